@@ -0,0 +1,141 @@
+"""Benchmark suite of the conversion hot path.
+
+Run ``python -m benchmarks`` at the root of the repository to measure
+the conversion time of pandas-dataclasses and its overhead relative to
+the hand-written ``pandas.DataFrame`` (or ``pandas.Series``) creation.
+Use ``--rows`` and ``--fields`` to change the sizes of data and
+``--filter`` to select benchmarks by name.
+
+"""
+
+# standard library
+from argparse import ArgumentParser
+from dataclasses import dataclass, field, make_dataclass
+from statistics import median
+from timeit import Timer
+from typing import Any, Callable, Optional
+
+
+# dependencies
+import numpy as np
+import pandas as pd
+from pandas_dataclasses import AsFrame, Data, Index, Multiple, Spec, asframe, asseries
+
+
+# constants
+DEFAULT_ROWS = (1, 10**3, 10**6)
+"""Default numbers of rows (use ``--rows 100000000`` for more)."""
+DEFAULT_FIELDS = (1, 10, 100)
+"""Default numbers of data fields (use ``--fields 1000`` for more)."""
+
+
+@dataclass
+class Case:
+    """Benchmark case of a conversion and its baseline."""
+
+    name: str
+    """Name of the benchmark case."""
+
+    rows: int
+    """Number of rows of data."""
+
+    fields: int
+    """Number of data fields."""
+
+    target: Callable[[], Any]
+    """Function of the conversion to be measured."""
+
+    baseline: Optional[Callable[[], Any]] = None
+    """Function of the hand-written pandas data creation."""
+
+
+def make_class(n_fields: int, multiple: bool = False, engine: str = "generic") -> Any:
+    """Make a dataclass with an index field and data fields."""
+    fields: list[Any] = [("index", Index[int])]
+
+    if multiple:
+        fields.append(("data", Multiple[Data[float]], field(default_factory=dict)))
+    else:
+        fields.extend((f"data_{i}", Data[float]) for i in range(n_fields))
+
+    namespace = {"__pandas_engine__": engine}
+    return make_dataclass(
+        f"Bench{n_fields}", fields, bases=(AsFrame,), namespace=namespace
+    )
+
+
+def make_cases(n_rows: int, n_fields: int) -> list[Case]:
+    """Make benchmark cases of given sizes of data."""
+    cls = make_class(n_fields)
+    cls_multiple = make_class(n_fields, multiple=True)
+    cls_codegen = make_class(n_fields, engine="codegen")
+    index = np.arange(n_rows)
+    values = {f"data_{i}": np.random.rand(n_rows) for i in range(n_fields)}
+    obj = cls(index, **values)
+    obj_multiple = cls_multiple(index, values)
+    obj_codegen = cls_codegen(index, **values)
+    spec = Spec.from_dataclass(cls)
+
+    def frame() -> pd.DataFrame:
+        return pd.DataFrame(values, index=pd.Index(index, name="index"))
+
+    def series() -> "pd.Series[Any]":
+        return pd.Series(values["data_0"], pd.Index(index, name="index"), name="data_0")
+
+    return [
+        Case("spec_compile", n_rows, n_fields, lambda: Spec.compile(cls)),
+        Case("spec_cached", n_rows, n_fields, lambda: Spec.from_dataclass(cls)),
+        Case("spec_update", n_rows, n_fields, lambda: spec @ obj),
+        Case("asframe", n_rows, n_fields, lambda: asframe(obj), frame),
+        Case(
+            "asseries",
+            n_rows,
+            n_fields,
+            lambda: asseries(obj, factory=pd.Series),
+            series,
+        ),
+        Case("new", n_rows, n_fields, lambda: cls.new(index, **values), frame),
+        Case("multiple", n_rows, n_fields, lambda: asframe(obj_multiple), frame),
+        Case("codegen", n_rows, n_fields, lambda: asframe(obj_codegen), frame),
+    ]
+
+
+def measure(func: Callable[[], Any], repeat: int) -> float:
+    """Measure the median time (in seconds) of a function call."""
+    timer = Timer(func)
+    number, _ = timer.autorange()
+    return median(timer.repeat(repeat, number)) / number
+
+
+def main() -> None:
+    """Run the benchmark suite and print the results."""
+    parser = ArgumentParser("python -m benchmarks", description=__doc__)
+    parser.add_argument("--rows", type=int, nargs="+", default=DEFAULT_ROWS)
+    parser.add_argument("--fields", type=int, nargs="+", default=DEFAULT_FIELDS)
+    parser.add_argument("--filter", type=str, nargs="*", default=None)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    header = f"{'name':<14}{'rows':>11}{'fields':>8}"
+    header += f"{'time [s]':>13}{'baseline [s]':>14}{'overhead':>10}"
+    print(header)
+    print("-" * len(header))
+
+    for n_rows in args.rows:
+        for n_fields in args.fields:
+            for case in make_cases(n_rows, n_fields):
+                if args.filter and case.name not in args.filter:
+                    continue
+
+                time = measure(case.target, args.repeat)
+                line = f"{case.name:<14}{case.rows:>11}{case.fields:>8}{time:>13.3e}"
+
+                if case.baseline is not None:
+                    baseline = measure(case.baseline, args.repeat)
+                    line += f"{baseline:>14.3e}{time / baseline:>9.2f}x"
+
+                print(line, flush=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -4,17 +4,32 @@ __all__ = [
     "AsFrame",
     "AsSeries",
     "Attr",
+    "CacheInfo",
     "Data",
     "Index",
+    "LazyFrame",
     "Multiple",
     "Spec",
     "Tag",
     "asdataframe",
     "asframe",
+    "asframe_chunks",
+    "asframe_many",
+    "asframe_parallel",
+    "asframe_records",
+    "asframe_shared",
+    "aslazyframe",
     "aspandas",
     "asseries",
+    "cache_info",
+    "clear_cache",
+    "clear_metrics",
     "core",
+    "enable_metrics",
     "extras",
+    "from_frame",
+    "from_frame_records",
+    "get_metrics",
 ]
 __version__ = "1.0.0"
 
@@ -23,6 +38,12 @@ __version__ = "1.0.0"
 from . import core
 from . import extras
 from .core.api import *
+from .core.batch import *
+from .core.cache import *
+from .core.inverse import *
+from .core.lazy import *
+from .core.metrics import *
+from .core.shared import *
 from .core.specs import *
 from .core.tagging import *
 from .core.typing import *
@@ -1,7 +1,24 @@
-__all__ = ["api", "specs", "tagging", "typing"]
+__all__ = [
+    "api",
+    "batch",
+    "cache",
+    "inverse",
+    "lazy",
+    "metrics",
+    "shared",
+    "specs",
+    "tagging",
+    "typing",
+]
 
 
 from . import api
+from . import batch
+from . import cache
+from . import inverse
+from . import lazy
+from . import metrics
+from . import shared
 from . import specs
 from . import tagging
 from . import typing
@@ -2,29 +2,67 @@ __all__ = ["asframe", "aspandas", "asseries"]
 
 
 # standard library
+from dataclasses import replace
+from functools import lru_cache
+from logging import DEBUG, getLogger
+from mmap import mmap
+from os import PathLike
 from types import FunctionType
-from typing import Any, Callable, Hashable, Iterable, Optional, overload
+from typing import Any, Callable, Hashable, Iterable, Literal, Optional, cast, overload
 
 
 # dependencies
 import numpy as np
 import pandas as pd
-from pandas.api.types import is_list_like
+from pandas.api.extensions import ExtensionArray
+from pandas.api.types import infer_dtype, is_bool_dtype, is_list_like
+from pandas.api.types import is_numeric_dtype, is_string_dtype, pandas_dtype
 from typing_extensions import get_origin
+from .cache import CONVERTER_CACHE, INDEX_CACHE, get_vocabulary
+from .metrics import METRICS
 from .specs import Field, Fields, Spec
 from .tagging import Tag
-from .typing import DataClass, DataClassOf, PAny, TFrame, TPandas, TSeries
+from .typing import Copy, DataClass, DataClassOf, PAny, TFrame, TPandas, TSeries
 
 
-@overload
-def aspandas(obj: DataClassOf[TPandas, PAny], *, factory: None = None) -> TPandas: ...
+# constants
+LOGGER = getLogger(__name__)
+"""Logger of pandas data creation."""
+
+RANGE_CHUNKSIZE = 2**16
+"""Number of values compared at once to check if data are evenly spaced."""
 
 
 @overload
-def aspandas(obj: DataClass[PAny], *, factory: Callable[..., TPandas]) -> TPandas: ...
+def aspandas(
+    obj: DataClassOf[TPandas, PAny],
+    *,
+    factory: None = None,
+    copy: Copy = True,
+    columns: Optional[Iterable[Hashable]] = None,
+    exclude: Optional[Iterable[Hashable]] = None,
+) -> TPandas: ...
 
 
-def aspandas(obj: Any, *, factory: Any = None) -> Any:
+@overload
+def aspandas(
+    obj: DataClass[PAny],
+    *,
+    factory: Callable[..., TPandas],
+    copy: Copy = True,
+    columns: Optional[Iterable[Hashable]] = None,
+    exclude: Optional[Iterable[Hashable]] = None,
+) -> TPandas: ...
+
+
+def aspandas(
+    obj: Any,
+    *,
+    factory: Any = None,
+    copy: Copy = True,
+    columns: Optional[Iterable[Hashable]] = None,
+    exclude: Optional[Iterable[Hashable]] = None,
+) -> Any:
     """Create a DataFrame or Series object from a dataclass object.
 
     Which data structure is created will be determined by a factory
@@ -46,51 +84,78 @@ def aspandas(obj: Any, *, factory: Any = None) -> Any:
             of the return type. If passed, it will be preferentially
             used even if the original dataclass of ``obj`` has the
             ``__pandas_factory__`` attribute.
+        copy: Copy mode of data. See ``asframe`` or ``asseries``.
+        columns: Data fields to be converted. See ``asframe`` or ``asseries``.
+        exclude: Data fields not to be converted. See ``asframe`` or ``asseries``.
 
     Returns:
         DataFrame or Series object that complies with the original dataclass.
 
     Raises:
         ValueError: Raised if no factory is found or the return type
-            cannot be inferred from a factory when it is a function.
+            cannot be inferred from a factory when it is a function,
+            or data would be copied in the ``"never"`` copy mode.
 
     """
-    spec = Spec.from_dataclass(type(obj)) @ obj
-
     if factory is None:
-        factory = spec.factory
+        factory = Spec.from_dataclass(obj.__class__).factory
 
     if factory is None:
         raise ValueError("Could not find any factory.")
 
-    if isinstance(factory, FunctionType):
-        return_ = factory.__annotations__["return"]
-    else:
-        return_ = factory
-
-    origin = get_origin(return_) or return_
-
-    if issubclass(origin, pd.DataFrame):
-        return asframe(obj, factory=factory)
-    elif issubclass(origin, pd.Series):
-        return asseries(obj, factory=factory)
+    if issubclass(kind := get_kind(factory), pd.DataFrame):
+        return asframe(
+            obj, factory=factory, copy=copy, columns=columns, exclude=exclude
+        )
+    elif issubclass(kind, pd.Series):
+        return asseries(
+            obj, factory=factory, copy=copy, columns=columns, exclude=exclude
+        )
     else:
         raise ValueError("Could not infer an object type.")
 
 
 @overload
-def asframe(obj: DataClassOf[TFrame, PAny], *, factory: None = None) -> TFrame: ...
+def asframe(
+    obj: DataClassOf[TFrame, PAny],
+    *,
+    factory: None = None,
+    copy: Copy = True,
+    columns: Optional[Iterable[Hashable]] = None,
+    exclude: Optional[Iterable[Hashable]] = None,
+) -> TFrame: ...
 
 
 @overload
-def asframe(obj: DataClass[PAny], *, factory: Callable[..., TFrame]) -> TFrame: ...
+def asframe(
+    obj: DataClass[PAny],
+    *,
+    factory: Callable[..., TFrame],
+    copy: Copy = True,
+    columns: Optional[Iterable[Hashable]] = None,
+    exclude: Optional[Iterable[Hashable]] = None,
+) -> TFrame: ...
 
 
 @overload
-def asframe(obj: DataClass[PAny], *, factory: None = None) -> pd.DataFrame: ...
-
-
-def asframe(obj: Any, *, factory: Any = None) -> Any:
+def asframe(
+    obj: DataClass[PAny],
+    *,
+    factory: None = None,
+    copy: Copy = True,
+    columns: Optional[Iterable[Hashable]] = None,
+    exclude: Optional[Iterable[Hashable]] = None,
+) -> pd.DataFrame: ...
+
+
+def asframe(
+    obj: Any,
+    *,
+    factory: Any = None,
+    copy: Copy = True,
+    columns: Optional[Iterable[Hashable]] = None,
+    exclude: Optional[Iterable[Hashable]] = None,
+) -> Any:
     """Create a DataFrame object from a dataclass object.
 
     The return type will be determined by a factory defined as the
@@ -110,39 +175,115 @@ def asframe(obj: Any, *, factory: Any = None) -> Any:
             and return an object of it or its subclass. If passed, it
             will be preferentially used even if the original dataclass
             of ``obj`` has the ``__pandas_factory__`` attribute.
+        copy: Copy mode of data. If ``False``, NumPy arrays or pandas
+            data whose data types already match those of data fields
+            will back the DataFrame object without copying. If ``"never"``,
+            it is the same as ``False`` but raises ``ValueError``
+            if any data would be copied. Index is not affected by it.
+            Values of data and index fields may be paths of NumPy
+            (``.npy``) files, which will be loaded as read-only memory
+            maps; use it with ``False`` to keep them memory-mapped.
+        columns: Data fields to be converted, selected by their
+            identifiers (attribute names) or (formatted) names, in the
+            order of the columns. Other data fields will never be cast
+            or copied. If not specified, all data fields are converted.
+        exclude: Data fields not to be converted, selected in the same
+            manner as ``columns``.
 
     Returns:
         DataFrame object that complies with the original dataclass.
 
+    Raises:
+        ValueError: Raised if data would be copied in the ``"never"``
+            copy mode, or any of ``columns`` is not found.
+
     """
-    spec = Spec.from_dataclass(type(obj)) @ obj
+    timer = METRICS.timer(obj.__class__)
+
+    if columns is None and exclude is None and copy is True:
+        if convert := get_converter(obj.__class__, "frame"):
+            dataframe = convert(obj, factory)
+            timer.lap("codegen")
+            return timer.stop(dataframe)
+
+    spec = Spec.from_dataclass(obj.__class__)
+    timer.lap("spec")
+    spec = project(spec @ obj, columns, exclude)
+    timer.lap("names")
 
     if factory is None:
         factory = spec.factory or pd.DataFrame
 
-    dataframe = factory(
-        data=get_data(spec),
-        index=get_index(spec),
-        columns=get_columns(spec),
-    )
+    if copy is True and (block := get_block(spec)) is not None:
+        timer.lap("data")
+        index = get_index(spec)
+        timer.lap("index")
 
-    dataframe.attrs.update(get_attrs(spec))
-    return squeeze(dataframe)
+        if (columns := get_columns(spec)) is None:
+            columns = get_names(spec)
 
+        timer.lap("columns")
+        dataframe = factory(data=block, index=index, columns=columns)
+    else:
+        data = get_data(spec, copy=copy)
+        timer.lap("data")
+        index = get_index(spec)
+        timer.lap("index")
+        columns = get_columns(spec)
+        timer.lap("columns")
+        dataframe = factory(
+            data=data,
+            index=index,
+            columns=columns,
+            **({} if copy is True else {"copy": False}),
+        )
 
-@overload
-def asseries(obj: DataClassOf[TSeries, PAny], *, factory: None = None) -> TSeries: ...
+    dataframe.attrs.update(get_attrs(spec))
+    timer.lap("factory")
+    return timer.stop(dataframe)
 
 
 @overload
-def asseries(obj: DataClass[PAny], *, factory: Callable[..., TSeries]) -> TSeries: ...
+def asseries(
+    obj: DataClassOf[TSeries, PAny],
+    *,
+    factory: None = None,
+    copy: Copy = True,
+    columns: Optional[Iterable[Hashable]] = None,
+    exclude: Optional[Iterable[Hashable]] = None,
+) -> TSeries: ...
 
 
 @overload
-def asseries(obj: DataClass[PAny], *, factory: None = None) -> "pd.Series[Any]": ...
+def asseries(
+    obj: DataClass[PAny],
+    *,
+    factory: Callable[..., TSeries],
+    copy: Copy = True,
+    columns: Optional[Iterable[Hashable]] = None,
+    exclude: Optional[Iterable[Hashable]] = None,
+) -> TSeries: ...
 
 
-def asseries(obj: Any, *, factory: Any = None) -> Any:
+@overload
+def asseries(
+    obj: DataClass[PAny],
+    *,
+    factory: None = None,
+    copy: Copy = True,
+    columns: Optional[Iterable[Hashable]] = None,
+    exclude: Optional[Iterable[Hashable]] = None,
+) -> "pd.Series[Any]": ...
+
+
+def asseries(
+    obj: Any,
+    *,
+    factory: Any = None,
+    copy: Copy = True,
+    columns: Optional[Iterable[Hashable]] = None,
+    exclude: Optional[Iterable[Hashable]] = None,
+) -> Any:
     """Create a Series object from a dataclass object.
 
     The return type will be determined by a factory defined as the
@@ -162,83 +303,615 @@ def asseries(obj: Any, *, factory: Any = None) -> Any:
             and return an object of it or its subclass. If passed, it
             will be preferentially used even if the original dataclass
             of ``obj`` has the ``__pandas_factory__`` attribute.
+        copy: Copy mode of data. If ``False``, NumPy arrays or pandas
+            data whose data types already match those of data fields
+            will back the Series object without copying. If ``"never"``,
+            it is the same as ``False`` but raises ``ValueError``
+            if any data would be copied. Index is not affected by it.
+            Values of data and index fields may be paths of NumPy
+            (``.npy``) files, which will be loaded as read-only memory
+            maps; use it with ``False`` to keep them memory-mapped.
+        columns: Data fields to be considered, selected by their
+            identifiers (attribute names) or (formatted) names. Only the
+            first one of them will be converted into the Series object.
+        exclude: Data fields not to be considered, selected in the same
+            manner as ``columns``.
 
     Returns:
         Series object that complies with the original dataclass.
 
+    Raises:
+        ValueError: Raised if data would be copied in the ``"never"``
+            copy mode, or any of ``columns`` is not found.
+
     """
-    spec = Spec.from_dataclass(type(obj)) @ obj
+    timer = METRICS.timer(obj.__class__)
+
+    if columns is None and exclude is None and copy is True:
+        if convert := get_converter(obj.__class__, "series"):
+            series = convert(obj, factory)
+            timer.lap("codegen")
+            return timer.stop(series)
+
+    spec = Spec.from_dataclass(obj.__class__)
+    timer.lap("spec")
+    spec = project(spec @ obj, columns, exclude, 1)
+    timer.lap("names")
 
     if factory is None:
         factory = spec.factory or pd.Series
 
-    data = get_data(spec)
+    data = get_data(spec, copy=copy)
+    timer.lap("data")
     index = get_index(spec)
+    timer.lap("index")
+    kwargs = {} if copy is True else {"copy": False}
 
     if not data:
-        series = factory(index=index)
+        series = factory(index=index, **kwargs)
     else:
         name, data = next(iter(data.items()))
-        series = factory(data=data, index=index, name=name)
+        series = factory(data=data, index=index, name=name, **kwargs)
 
     series.attrs.update(get_attrs(spec))
-    return squeeze(series)
+    timer.lap("factory")
+    return timer.stop(series)
 
 
 def get_attrs(spec: Spec) -> dict[Hashable, Any]:
     """Derive attributes from a specification."""
     data: dict[Hashable, Any] = {}
 
-    for field in spec.fields.of(Tag.ATTR):
+    for field in spec.attrs:
         data.update(items(field))
 
     return data
 
 
-def get_columns(spec: Spec) -> Optional[pd.MultiIndex]:
-    """Derive columns from a specification."""
-    if not (fields := spec.fields.of(Tag.DATA)):
+def get_block(spec: Spec) -> Optional[np.ndarray]:
+    """Derive data as a 2D array from a specification (if possible).
+
+    If all data fields have the same numeric data type (determined at
+    compile time) and data of the same length, they are written into
+    a 2D array preallocated in column-major order, so that a DataFrame
+    object will be created from it without consolidation or copying.
+    The same applies to a single multiple-item data field given as
+    a 2D array (see ``get_matrix``). Otherwise (or if data may be
+    categorized or downcast by a specification, or if names of data
+    are not unique), ``None`` is returned.
+
+    """
+    if spec.categorize or spec.downcast is not None:
+        return None
+
+    if len(spec.data) == 1 and spec.data[0].has(Tag.MULTIPLE):
+        if not is_unique(get_labels(spec.data[0].default)):
+            return None
+
+        return get_matrix(spec.data[0])
+
+    if (dtype := spec.dtype) is None or not is_unique(map(name, spec.data)):
+        return None
+
+    return build_block([field.default for field in spec.data], dtype)
+
+
+def build_block(data: list[Any], dtype: str) -> Optional[np.ndarray]:
+    """Build a 2D array from 1D data of the same length (if possible).
+
+    Data (loaded from paths if any) are written as columns into a 2D
+    array preallocated with given data type in column-major order.
+    If any data are not list-like or their lengths are different,
+    ``None`` is returned.
+
+    """
+    data = list(map(load, data))
+
+    if not all(map(is_list_like, data)):
+        return None
+
+    if len(lengths := set(map(len, data))) != 1:
+        return None
+
+    block = np.empty((lengths.pop(), len(data)), dtype, order="F")
+
+    for i, val in enumerate(data):
+        block[:, i] = val if is_viewable(val, dtype) else ensure(val, dtype)
+
+    return block
+
+
+def get_columns(spec: Spec) -> Optional["pd.Index[Any]"]:
+    """Derive columns from a specification.
+
+    Columns will be a single-level index if names of data fields
+    have only one level. Otherwise, they will be a multi-level one.
+    They are built once per distinct set of (formatted) names and
+    views of them are returned (see ``build_columns``).
+
+    """
+    if not (fields := spec.data):
         return None
 
     if (names := name(fields)) is None:
         return None
 
-    return pd.MultiIndex.from_tuples(
-        map(name, fields),
-        names=names,
-    )
+    return build_columns(names, tuple(map(name, fields))).view()  # type: ignore
+
+
+@lru_cache(maxsize=256)
+def build_columns(
+    names: tuple[Hashable, ...],
+    labels: tuple[tuple[Hashable, ...], ...],
+) -> "pd.Index[Any]":
+    """Build columns from names of levels and labels of each column.
+
+    Columns are cached by the names and labels (up to 256 sets with the
+    least-recently-used eviction), so that those of data fields with
+    static names will be built only once per dataclass, and those with
+    dynamic names once per distinct set of formatted names.
+
+    """
+    if len(names) == 1:
+        return pd.Index(
+            [label[0] for label in labels],
+            name=names[0],
+            tupleize_cols=False,
+        )
+
+    return pd.MultiIndex.from_tuples(labels, names=names)
+
+
+def get_labels(data: Any) -> Iterable[Hashable]:
+    """Derive labels of data of a multiple-item field."""
+    if isinstance(data, pd.DataFrame):
+        return data.columns
+    elif isinstance(data, tuple):
+        return data[0]  # type: ignore
+    else:
+        return data.keys()
+
+
+def get_matrix(field: Field) -> Optional[np.ndarray]:
+    """Derive data of a multiple-item field as a 2D array (if possible).
+
+    Data given as a homogeneous DataFrame object or a pair of labels
+    and a 2D array are cast into a 2D array in column-major order at
+    once (i.e. one copy), unless the cast would lose information.
+
+    """
+    if isinstance(data := field.default, pd.DataFrame):
+        if data.dtypes.nunique() != 1:
+            return None
+
+        matrix: Any = data.to_numpy()
+    elif isinstance(data, tuple):
+        matrix = np.asarray(data[1])  # type: ignore
+    else:
+        return None
+
+    if not isinstance(dtype := pandas_dtype(field.dtype or matrix.dtype), np.dtype):
+        return None
+
+    if not np.can_cast(matrix.dtype, dtype, "same_kind"):
+        return None
+
+    return matrix.astype(dtype, order="F")
+
+
+def get_names(spec: Spec) -> "pd.Index[Any]":
+    """Derive columns of names (or labels) of data fields."""
+    names: list[Hashable] = []
+
+    for field in spec.data:
+        if field.has(Tag.MULTIPLE):
+            names.extend(get_labels(field.default))
+        else:
+            names.append(name(field))
+
+    return pd.Index(names)
+
+
+def get_data(spec: Spec, copy: Copy = True) -> dict[Hashable, Any]:
+    """Derive data from a specification.
 
+    If ``copy`` is ``"never"``, ``ValueError`` will be raised
+    if any data cannot be converted without copying.
 
-def get_data(spec: Spec) -> dict[Hashable, Any]:
-    """Derive data from a specification."""
+    """
     data: dict[Hashable, Any] = {}
 
-    for field in spec.fields.of(Tag.DATA):
+    for field in spec.data:
         for key, val in items(field):
-            data[key] = ensure(val, field.dtype)
+            val = load(val)
+
+            if copy == "never" and not is_viewable(val, field.dtype):
+                raise ValueError(f"Data {key!r} would be copied.")
+
+            if copy == "never" and field.id in spec.categorize:
+                raise ValueError(f"Data {key!r} would be copied.")
+
+            data[key] = convert(spec, field, key, val, copy)
 
     return data
 
 
-def get_index(spec: Spec) -> Optional[pd.MultiIndex]:
-    """Derive index from a specification."""
-    if not (fields := spec.fields.of(Tag.INDEX)):
-        return None
+def get_index(spec: Spec) -> Optional["pd.Index[Any]"]:
+    """Derive index from a specification.
+
+    If data of all index fields are immutable (see ``is_immutable``)
+    and none of them are categorized (whose categories may grow), the
+    index will be cached by their identities in ``INDEX_CACHE``, so
+    that a repeated axis will be shared without being built again.
 
+    """
     data: dict[Hashable, Any] = {}
+    identity: list[Hashable] = []
+    sources: list[Any] = []
 
-    for field in fields:
+    for field in spec.index:
         for key, val in items(field):
-            data[key] = ensure(val, field.dtype)
+            data[key] = (field, val)
+            identity.append((key, field.dtype, id(val)))
+            sources.append(val)
 
-    return pd.MultiIndex.from_arrays(
-        np.broadcast_arrays(*data.values()),
-        names=data.keys(),
+    cached = all(map(is_immutable, sources)) and not any(
+        field.id in spec.categorize for field in spec.index
     )
 
+    if cached:
+        if (index := INDEX_CACHE.get(tuple(identity))) is not None:
+            return index
+
+    index = build_index(
+        {key: convert(spec, field, key, val) for key, (field, val) in data.items()}
+    )
+
+    if not cached or index is None:
+        return index
+
+    INDEX_CACHE.set(tuple(identity), sources, index)
+    return index.view()
+
+
+def build_index(data: dict[Hashable, Any]) -> Optional["pd.Index[Any]"]:
+    """Build the cheapest index from 1D data of each level.
+
+    A single level will become a range index (if data are evenly-spaced
+    64-bit integers) or an index of the data type without factorizing
+    them. Only multiple levels will become a multi-level index, where
+    data are broadcast to each other if they have different lengths.
+
+    """
+    if not data:
+        return None
+
+    if len(data) == 1:
+        ((key, val),) = data.items()
+
+        if (index := get_range(val)) is not None:
+            return index.rename(key)
+        else:
+            return pd.Index(val, name=key, copy=False)
+
+    if len(set(map(len, data.values()))) == 1:
+        arrays = list(data.values())
+    else:
+        arrays = np.broadcast_arrays(*data.values())
+
+    return pd.MultiIndex.from_arrays(arrays, names=list(data.keys()))
+
+
+def get_range(data: Any) -> Optional[pd.RangeIndex]:
+    """Convert 1D data into a range index if they are evenly spaced.
+
+    Data are rejected early by their first, second, and last values,
+    and then compared with ranges in chunks (see ``RANGE_CHUNKSIZE``),
+    so that no temporary array of the same length is allocated.
+
+    """
+    if len(data) < 2 or data.dtype.name != "int64":
+        return None
+
+    values = np.asarray(data)
+
+    if is_mapped(values):
+        return None
+
+    start, stop = int(values[0]), int(values[-1])
+
+    if not (step := int(values[1]) - start):
+        return None
+
+    if stop - start != step * (len(values) - 1):
+        return None
+
+    for offset in range(0, len(values), RANGE_CHUNKSIZE):
+        chunk = values[offset : offset + RANGE_CHUNKSIZE]
+        first = start + step * offset
+
+        if not np.array_equal(chunk, np.arange(first, first + step * len(chunk), step)):
+            return None
+
+    return pd.RangeIndex(start, stop + step, step)
+
+
+def get_converter(
+    dataclass: type,
+    kind: Literal["frame", "series"],
+) -> Optional[Callable[[Any, Any], Any]]:
+    """Derive a code-generated converter of a dataclass (if possible).
+
+    A converter will be generated only if the engine of the dataclass
+    is ``"codegen"`` and it has neither multiple-item fields, names
+    with format placeholders, nor conversion policies (categorization
+    or downcast). Otherwise, ``None`` will be returned and the generic
+    conversion should be used. Converters are cached in the dataclass
+    by ``CONVERTER_CACHE``, so that they are compiled only once.
+
+    """
+    return CONVERTER_CACHE.get(dataclass, compile_converters)[kind]
+
+
+def compile_converters(
+    dataclass: type,
+) -> dict[str, Optional[Callable[[Any, Any], Any]]]:
+    """Compile code-generated converters of a dataclass (if possible)."""
+    spec = Spec.from_dataclass(dataclass)
+
+    if spec.engine != "codegen" or spec.categorize or spec.downcast:
+        return {"frame": None, "series": None}
+
+    for field in spec.attrs + spec.data + spec.index:
+        if field.has(Tag.MULTIPLE) or field.dynamic:
+            return {"frame": None, "series": None}
+
+    return {
+        "frame": compile_converter(spec, "frame"),
+        "series": compile_converter(spec, "series"),
+    }
+
+
+def compile_converter(
+    spec: Spec,
+    kind: Literal["frame", "series"],
+) -> Callable[[Any, Any], Any]:
+    """Compile a straight-line converter from a specification.
+
+    Like ``__init__`` of a dataclass, the converter is generated as
+    Python source code that reads each attribute of an object, ensures
+    its data type, and calls a factory without any loops over fields.
+    Names, data types, and columns are bound as constants of it. If all
+    data fields have the same numeric data type, a frame converter will
+    first try to build a 2D array of them (see ``build_block``).
+
+    """
+    if kind == "frame":
+        default = spec.factory or pd.DataFrame
+    else:
+        default = spec.factory or pd.Series
+
+    columns = get_columns(spec)
+    namespace: dict[str, Any] = {
+        "build_block": build_block,
+        "build_index": build_index,
+        "columns": columns,
+        "default": default,
+        "ensure": ensure,
+        "names": {},
+        "dtypes": {},
+    }
+
+    def get(field: Field, with_dtype: bool) -> str:
+        namespace["names"][field.id] = name(field)
+        namespace["dtypes"][field.id] = field.dtype
+        obj = f"obj.{field.id}"
+
+        if with_dtype:
+            return f"ensure({obj}, dtypes[{field.id!r}])"
+        else:
+            return obj
+
+    def join(fields: Fields, with_dtype: bool) -> str:
+        return ", ".join(
+            f"names[{field.id!r}]: {get(field, with_dtype)}" for field in fields
+        )
+
+    lines = [
+        "def convert(obj, factory):",
+        "    if factory is None:",
+        "        factory = default",
+        f"    index = build_index({{{join(spec.index, True)}}})",
+    ]
+
+    if kind == "frame":
+        lines += [
+            "    columns_ = None if columns is None else columns.view()",
+        ]
+
+    if kind == "frame" and spec.dtype is not None and is_unique(map(name, spec.data)):
+        values = ", ".join(get(field, False) for field in spec.data)
+        namespace["labels"] = get_names(spec) if columns is None else columns
+        lines += [
+            f"    block = build_block([{values}], {spec.dtype!r})",
+            "    if block is not None:",
+            "        columns_ = labels.view()",
+            "        pandas = factory(data=block, index=index, columns=columns_)",
+            "    else:",
+            f"        data = {{{join(spec.data, True)}}}",
+            "        pandas = factory(data=data, index=index, columns=columns_)",
+        ]
+    elif kind == "frame":
+        lines += [
+            f"    data = {{{join(spec.data, True)}}}",
+            "    pandas = factory(data=data, index=index, columns=columns_)",
+        ]
+    elif spec.data:
+        field = spec.data[0]
+        lines += [
+            f"    data = {get(field, True)}",
+            f"    name = names[{field.id!r}]",
+            "    pandas = factory(data=data, index=index, name=name)",
+        ]
+    else:
+        lines += [
+            "    pandas = factory(index=index)",
+        ]
+
+    if spec.attrs:
+        lines += [
+            f"    pandas.attrs.update({{{join(spec.attrs, False)}}})",
+        ]
+
+    lines += [
+        "    return pandas",
+    ]
+
+    filename = f"<pandas-dataclasses {spec.name}.{kind}>"
+    exec(compile("\n".join(lines), filename, "exec"), namespace)
+    return namespace["convert"]
+
+
+@lru_cache(maxsize=256)
+def get_kind(factory: Callable[..., Any]) -> Any:
+    """Derive a type of pandas data created by a factory.
+
+    The result is cached per factory, so that the return annotation
+    of a function factory is inspected only once.
+
+    """
+    if isinstance(factory, FunctionType):
+        return_ = factory.__annotations__["return"]
+    else:
+        return_ = factory
+
+    return get_origin(return_) or return_
+
+
+def convert(
+    spec: Spec,
+    field: Field,
+    key: Hashable,
+    data: Any,
+    copy: Copy = True,
+) -> Any:
+    """Convert data of a field (item) by the policies of a specification.
+
+    Data of fields to be categorized are encoded as categorical data
+    by the vocabulary of the field (item) shared by conversions, so
+    that known values are never factorized again. Otherwise, data are
+    ensured to have the data type of the field, and then downcast if
+    the field is an untyped data field and ``copy`` is not ``"never"``.
+
+    """
+    if field.id in spec.categorize and spec.origin is not None:
+        vocabulary = get_vocabulary(spec.origin, (field.id, key))
+        return vocabulary.encode(ensure(data, field.dtype))
+
+    data = ensure(data, field.dtype)
+
+    if spec.downcast is None or copy == "never":
+        return data
+
+    if field.dtype is not None or not field.has(Tag.DATA):
+        return data
+
+    if (downcast_data := downcast(data)) is data:
+        return data
+
+    if METRICS.enabled or LOGGER.isEnabledFor(DEBUG):
+        saved = get_memory(data) - get_memory(downcast_data)
+        LOGGER.debug("Downcast %r to %s (%d B saved).", key, downcast_data.dtype, saved)
+
+        if METRICS.enabled and spec.origin is not None:
+            METRICS.save(spec.origin, saved)
+
+    return downcast_data
+
+
+def downcast(data: Any) -> Any:
+    """Downcast data to the smallest data type without loss of information.
+
+    Integers are downcast to the smallest integers of the same kind
+    (signed or unsigned) that can hold their range, and floats to
+    32-bit floats if they are all exactly representable by them.
+    Strings are converted into the PyArrow-backed string data type
+    if PyArrow is installed. Otherwise, strings are kept as they are,
+    since the Python-backed one would not save memory. Data of other
+    data types are also returned as they are.
+
+    """
+    dtype = data.dtype
+
+    if is_string_dtype(dtype) and (string := get_string_dtype()) is not None:
+        if dtype != string and infer_dtype(data) == "string":
+            return data.astype(string)
+
+    if not is_numeric_dtype(dtype) or is_bool_dtype(dtype) or not len(data):
+        return data
+
+    if (np_dtype := get_smallest(data)) is None:
+        return data
+
+    if isinstance(dtype, np.dtype):
+        return data.astype(np_dtype)
+
+    if dtype.name == get_masked(dtype.numpy_dtype):
+        return data.astype(get_masked(np_dtype))
+
+    return data
+
+
+def get_smallest(data: Any) -> Optional[np.dtype]:
+    """Get the smallest NumPy data type of numeric data (if any)."""
+    dtype = data.dtype
+
+    if dtype.kind in "iu":
+        if pd.isna(low := data.min()) or pd.isna(high := data.max()):
+            return None
+
+        for itemsize in (1, 2, 4):
+            if itemsize >= dtype.itemsize:
+                return None
+
+            np_dtype = np.dtype(f"{dtype.kind}{itemsize}")
+            info = np.iinfo(np_dtype)
+
+            if info.min <= low and high <= info.max:
+                return np_dtype
+
+    if dtype.kind == "f" and dtype.itemsize > 4:
+        values = pd.Index(data, copy=False).to_numpy("float64", na_value=np.nan)
+
+        if np.array_equal(values.astype("float32"), values, equal_nan=True):
+            return np.dtype("float32")
+
+    return None
+
+
+def get_masked(dtype: np.dtype) -> str:
+    """Get the name of a nullable data type from a NumPy data type."""
+    return dtype.name.upper().replace("INT", "Int").replace("FLOAT", "Float")
+
+
+def get_memory(data: Any) -> int:
+    """Get the bytes of data including the objects referenced by them."""
+    return int(pd.Series(data, copy=False).memory_usage(index=False, deep=True))
+
+
+@lru_cache(maxsize=None)
+def get_string_dtype() -> Optional["pd.StringDtype[Any]"]:
+    """Get the PyArrow-backed string data type (if PyArrow is installed)."""
+    try:
+        return pd.StringDtype("pyarrow")
+    except ImportError:
+        return None
+
 
 def ensure(data: Any, dtype: Optional[str]) -> Any:
     """Ensure data to be 1D and have given data type."""
+    data = load(data)
+
     if not is_list_like(data):
         data = [data]
 
@@ -248,12 +921,91 @@ def ensure(data: Any, dtype: Optional[str]) -> Any:
         return pd.array(data, dtype=dtype, copy=False)
 
 
-def items(field: Field) -> Iterable[tuple[Hashable, Any]]:
-    """Generate default(s) of a field specification."""
-    if field.has(Tag.MULTIPLE):
-        yield from field.default.items()
+def is_unique(keys: Iterable[Hashable]) -> bool:
+    """Check if keys (names or labels) of data have no duplicates."""
+    keys = list(keys)
+    return len(set(keys)) == len(keys)
+
+
+def is_viewable(data: Any, dtype: Optional[str]) -> bool:
+    """Check if data can be ensured to have given data type without copying.
+
+    If no data type is given, NumPy arrays of Unicode strings are not
+    viewable as they are converted into string arrays by ``pd.array``.
+
+    """
+    if not isinstance(data, (np.ndarray, ExtensionArray, pd.Index, pd.Series)):
+        return False
+
+    if data.ndim != 1:
+        return False
+
+    if dtype is None:
+        return cast(Any, data).dtype.kind != "U"
     else:
+        return cast(Any, data).dtype == pandas_dtype(dtype)
+
+
+def is_immutable(data: Any) -> bool:
+    """Check if data (and their identity) can never change in place.
+
+    Scalars, tuples, ranges, pandas indexes, and arrays whose memory
+    (including that of their bases) is read-only are immutable, while
+    paths and memory-mapped arrays are not (as files may be changed).
+
+    """
+    if isinstance(data, PathLike):
+        return False
+
+    if isinstance(data, (tuple, range, pd.Index)) or not is_list_like(data):
+        return True
+
+    base: Any = data
+
+    while isinstance(base, np.ndarray):
+        if base.flags.writeable or isinstance(base, np.memmap):
+            return False
+
+        base = base.base
+
+    return base is not data
+
+
+def is_mapped(data: np.ndarray) -> bool:
+    """Check if an array is backed by a memory-mapped file."""
+    base: Any = data
+
+    while base is not None:
+        if isinstance(base, (np.memmap, mmap)):
+            return True
+
+        base = getattr(base, "base", None)
+
+    return False
+
+
+def items(field: Field) -> Iterable[tuple[Hashable, Any]]:
+    """Generate default(s) of a field specification.
+
+    Default of a multiple-item field is split into items (see ``split``).
+
+    """
+    if not field.has(Tag.MULTIPLE):
         yield (name(field), field.default)
+    else:
+        yield from split(field.default)
+
+
+def load(data: Any) -> Any:
+    """Load data from a path of a NumPy file as a memory-mapped array.
+
+    Data other than a path-like object will be returned as they are.
+
+    """
+    if isinstance(data, PathLike):
+        return np.load(data, mmap_mode="r")  # type: ignore
+    else:
+        return data
 
 
 @overload
@@ -278,15 +1030,71 @@ def name(fields: Any) -> Any:
                 return tuple(name.keys())
 
 
-def squeeze(data: TPandas) -> TPandas:
-    """Drop levels of an index and columns if possible."""
-    if data.index.nlevels == 1:
-        data.index = data.index.get_level_values(0)
+def project(
+    spec: Spec,
+    columns: Optional[Iterable[Hashable]] = None,
+    exclude: Optional[Iterable[Hashable]] = None,
+    limit: Optional[int] = None,
+) -> Spec:
+    """Select data fields of a specification by identifiers or names.
 
-    if isinstance(data, pd.Series):
-        return data  # type: ignore
+    Data fields are selected (in the order of ``columns``) before any
+    data are converted, and then ``exclude`` and ``limit`` are applied.
+    Attribute and index fields are always kept as they are.
 
-    if data.columns.nlevels == 1:
-        data.columns = data.columns.get_level_values(0)
+    """
+    if columns is None and exclude is None and limit is None:
+        return spec
 
-    return data
+    fields = list(spec.data)
+
+    if columns is not None:
+        fields = [select(fields, key) for key in columns]
+
+    if exclude is not None:
+        ids = [id(select(fields, key, None)) for key in exclude]
+        fields = [field for field in fields if id(field) not in ids]
+
+    return replace(
+        spec,
+        fields=Fields((*spec.attrs, *spec.index, *fields[:limit])),
+    )
+
+
+def select(fields: list[Field], key: Hashable, *default: Any) -> Any:
+    """Select a field by its identifier or (formatted) name."""
+    for field in fields:
+        if key == field.id:
+            return field
+
+    for field in fields:
+        if key == name(field):
+            return field
+
+    if default:
+        return default[0]
+
+    raise ValueError(f"Could not find any data field of {key!r}.")
+
+
+def split(data: Any) -> Iterable[tuple[Hashable, Any]]:
+    """Split data of a multiple-item field into items.
+
+    Data may be a dictionary, a DataFrame object (whose columns will be
+    generated as arrays without its own index), or a pair of labels and
+    a 2D array (whose columns will be generated as views of it).
+
+    """
+    if isinstance(data, pd.DataFrame):
+        for key, column in data.items():
+            yield (key, column.values)
+    elif isinstance(data, tuple):
+        labels, values = cast(tuple[Any, Any], data)
+        values = np.asarray(values)
+
+        if values.ndim != 2 or len(labels) != values.shape[1]:
+            raise ValueError("Labels must be given for each column of 2D data.")
+
+        yield from zip(labels, values.T)
+    else:
+        yield from data.items()
@@ -0,0 +1,573 @@
+__all__ = [
+    "asframe_chunks",
+    "asframe_many",
+    "asframe_parallel",
+    "asframe_records",
+]
+
+
+# standard library
+from concurrent.futures import Executor, ThreadPoolExecutor
+from functools import partial
+from itertools import chain, islice
+from operator import attrgetter
+from typing import (
+    Any,
+    Callable,
+    Hashable,
+    Iterable,
+    Iterator,
+    Optional,
+    Sequence,
+    overload,
+)
+
+
+# dependencies
+import numpy as np
+import pandas as pd
+from pandas.api.types import is_list_like, pandas_dtype
+from .api import asframe, build_index, ensure, get_attrs, get_columns, items, load
+from .api import name
+from .specs import Fields, Spec
+from .tagging import Tag
+from .typing import Copy, DataClass, DataClassOf, PAny, TFrame
+
+
+@overload
+def asframe_many(
+    objs: Iterable[DataClassOf[TFrame, PAny]],
+    *,
+    factory: None = None,
+) -> TFrame: ...
+
+
+@overload
+def asframe_many(
+    objs: Iterable[DataClass[PAny]],
+    *,
+    factory: Callable[..., TFrame],
+) -> TFrame: ...
+
+
+@overload
+def asframe_many(
+    objs: Iterable[DataClass[PAny]],
+    *,
+    factory: None = None,
+) -> pd.DataFrame: ...
+
+
+def asframe_many(objs: Iterable[Any], *, factory: Any = None) -> Any:
+    """Create a DataFrame object from dataclass objects.
+
+    Data and index of the dataclass objects are gathered field by field
+    and cast into contiguous arrays at once, which is equivalent to but
+    much faster than creating a DataFrame object from each dataclass
+    object and concatenating them by ``pandas.concat``. Length-one data
+    or index of each dataclass object is broadcast to the others.
+    If the original dataclass has no index fields, the index of the
+    DataFrame object will be a range index over all rows.
+
+    Args:
+        objs: Dataclass objects of the same dataclass that should have
+            the same column names and attributes. If the original
+            dataclass has the ``__pandas_factory__`` attribute, it
+            will be used as a factory for the DataFrame creation.
+
+    Keyword Args:
+        factory: Class or function for the DataFrame creation.
+            It must take the same parameters as ``pandas.DataFrame``,
+            and return an object of it or its subclass. If passed, it
+            will be preferentially used even if the original dataclass
+            of ``objs`` has the ``__pandas_factory__`` attribute.
+
+    Returns:
+        DataFrame object that complies with the original dataclass.
+
+    Raises:
+        TypeError: Raised if the dataclass objects are not of the same
+            dataclass.
+        ValueError: Raised if no dataclass object is given, column
+            names or attributes differ between the dataclass objects,
+            or data and index of any of them have different lengths.
+
+    """
+    objs = iter(objs)
+
+    if (first := next(objs, None)) is None:
+        raise ValueError("Could not find any dataclass object.")
+
+    spec = Spec.from_dataclass(first.__class__)
+    first_spec = spec @ first
+    attrs = get_attrs(first_spec)
+    index: dict[Hashable, list[Any]] = {}
+    data: dict[Hashable, list[Any]] = {}
+
+    for obj in chain([first], objs):
+        if type(obj) is not spec.origin:
+            raise TypeError("Dataclass objects must be of the same dataclass.")
+
+        if obj is not first:
+            if not equals(get_attrs(obj_spec := spec @ obj), attrs):
+                raise ValueError("Attributes must be the same.")
+        else:
+            obj_spec = first_spec
+
+        index_items = get_items(obj_spec.index)
+        data_items = get_items(obj_spec.data)
+
+        if index and index.keys() != index_items.keys():
+            raise ValueError("Index names must be the same.")
+
+        if data and data.keys() != data_items.keys():
+            raise ValueError("Column names must be the same.")
+
+        length = get_length([*index_items.values(), *data_items.values()])
+        gather(index_items, index, length)
+        gather(data_items, data, length)
+
+    if factory is None:
+        factory = spec.factory or pd.DataFrame
+
+    index_dtypes = get_dtypes(first_spec.index)
+    data_dtypes = get_dtypes(first_spec.data)
+
+    dataframe = factory(
+        data={key: concat(vals, data_dtypes[key]) for key, vals in data.items()},
+        index=build_index(
+            {key: concat(vals, index_dtypes[key]) for key, vals in index.items()}
+        ),
+        columns=get_columns(first_spec),
+    )
+
+    dataframe.attrs.update(attrs)
+    return dataframe
+
+
+@overload
+def asframe_records(
+    objs: Iterable[DataClassOf[TFrame, PAny]],
+    *,
+    factory: None = None,
+) -> TFrame: ...
+
+
+@overload
+def asframe_records(
+    objs: Iterable[DataClass[PAny]],
+    *,
+    factory: Callable[..., TFrame],
+) -> TFrame: ...
+
+
+@overload
+def asframe_records(
+    objs: Iterable[DataClass[PAny]],
+    *,
+    factory: None = None,
+) -> pd.DataFrame: ...
+
+
+def asframe_records(objs: Iterable[Any], *, factory: Any = None) -> Any:
+    """Create a DataFrame object from dataclass objects as records.
+
+    Each dataclass object will become a row of the DataFrame object,
+    and thus data and index fields should have scalar values. Values
+    of each field are filled into an array preallocated with the data
+    type of the field, and index fields are converted into an index
+    at once. Column names and attributes are derived from the first
+    dataclass object, and those of the others are not evaluated.
+
+    Args:
+        objs: Dataclass objects of the same dataclass that should have
+            scalar values in data and index fields. If the original
+            dataclass has the ``__pandas_factory__`` attribute, it
+            will be used as a factory for the DataFrame creation.
+
+    Keyword Args:
+        factory: Class or function for the DataFrame creation.
+            It must take the same parameters as ``pandas.DataFrame``,
+            and return an object of it or its subclass. If passed, it
+            will be preferentially used even if the original dataclass
+            of ``objs`` has the ``__pandas_factory__`` attribute.
+
+    Returns:
+        DataFrame object that complies with the original dataclass.
+
+    Raises:
+        TypeError: Raised if the dataclass objects are not of the same
+            dataclass.
+        ValueError: Raised if no dataclass object is given.
+
+    """
+    if not isinstance(objs, Sequence):
+        objs = list(objs)
+
+    if not objs:
+        raise ValueError("Could not find any dataclass object.")
+
+    spec = Spec.from_dataclass(objs[0].__class__)
+    first_spec = spec @ objs[0]
+
+    if not all(type(obj) is spec.origin for obj in objs):
+        raise TypeError("Dataclass objects must be of the same dataclass.")
+
+    if factory is None:
+        factory = spec.factory or pd.DataFrame
+
+    index = {
+        key: fill(map(getter, objs), len(objs), dtype)
+        for key, (getter, dtype) in get_getters(first_spec.index).items()
+    }
+
+    dataframe = factory(
+        data={
+            key: fill(map(getter, objs), len(objs), dtype)
+            for key, (getter, dtype) in get_getters(first_spec.data).items()
+        },
+        index=build_index(index),
+        columns=get_columns(first_spec),
+    )
+
+    dataframe.attrs.update(get_attrs(first_spec))
+    return dataframe
+
+
+@overload
+def asframe_chunks(
+    objs: Iterable[DataClassOf[TFrame, PAny]],
+    *,
+    chunk_rows: Optional[int] = None,
+    max_bytes: Optional[int] = None,
+    factory: None = None,
+) -> Iterator[TFrame]: ...
+
+
+@overload
+def asframe_chunks(
+    objs: Iterable[DataClass[PAny]],
+    *,
+    chunk_rows: Optional[int] = None,
+    max_bytes: Optional[int] = None,
+    factory: Callable[..., TFrame],
+) -> Iterator[TFrame]: ...
+
+
+@overload
+def asframe_chunks(
+    objs: Iterable[DataClass[PAny]],
+    *,
+    chunk_rows: Optional[int] = None,
+    max_bytes: Optional[int] = None,
+    factory: None = None,
+) -> Iterator[pd.DataFrame]: ...
+
+
+def asframe_chunks(
+    objs: Iterable[Any],
+    *,
+    chunk_rows: Optional[int] = None,
+    max_bytes: Optional[int] = None,
+    factory: Any = None,
+) -> Iterator[Any]:
+    """Create DataFrame objects of bounded size from dataclass objects.
+
+    This is a streaming version of ``asframe_records``: dataclass
+    objects are consumed lazily, and each chunk of them will become
+    a DataFrame object. Values of each field are filled into arrays
+    newly preallocated for each chunk (see ``asframe_records``), which
+    are owned by the DataFrame object without being copied again.
+    Column names and attributes are derived from the first dataclass
+    object, so that they are identical for all chunks.
+
+    Args:
+        objs: Dataclass objects of the same dataclass that should have
+            scalar values in data and index fields. If the original
+            dataclass has the ``__pandas_factory__`` attribute, it
+            will be used as a factory for the DataFrame creation.
+
+    Keyword Args:
+        chunk_rows: Maximum number of rows of each DataFrame object.
+        max_bytes: Maximum number of bytes of data and index of each
+            DataFrame object estimated from the data types of fields.
+            If both ``chunk_rows`` and ``max_bytes`` are given,
+            the smaller number of rows will be used.
+        factory: Class or function for the DataFrame creation.
+            It must take the same parameters as ``pandas.DataFrame``,
+            and return an object of it or its subclass. If passed, it
+            will be preferentially used even if the original dataclass
+            of ``objs`` has the ``__pandas_factory__`` attribute.
+
+    Yields:
+        DataFrame objects that comply with the original dataclass.
+
+    Raises:
+        TypeError: Raised if the dataclass objects are not of the same
+            dataclass.
+        ValueError: Raised if neither ``chunk_rows`` nor ``max_bytes``
+            is given, or they are not positive.
+
+    """
+    if chunk_rows is None and max_bytes is None:
+        raise ValueError("Either chunk_rows or max_bytes must be given.")
+
+    objs = iter(objs)
+
+    if (first := next(objs, None)) is None:
+        return
+
+    spec = Spec.from_dataclass(first.__class__)
+    first_spec = spec @ first
+    attrs = get_attrs(first_spec)
+    columns = get_columns(first_spec)
+    index_getters = get_getters(first_spec.index)
+    data_getters = get_getters(first_spec.data)
+    getters = {**index_getters, **data_getters}
+    sizes: list[int] = []
+
+    if chunk_rows is not None:
+        sizes.append(chunk_rows)
+
+    if max_bytes is not None:
+        sizes.append(max_bytes // get_itemsize(getters))
+
+    if (rows := min(sizes)) < 1:
+        raise ValueError("Chunk size must be positive.")
+
+    if factory is None:
+        factory = spec.factory or pd.DataFrame
+
+    objs = chain([first], objs)
+
+    while chunk := list(islice(objs, rows)):
+        if not all(type(obj) is spec.origin for obj in chunk):
+            raise TypeError("Dataclass objects must be of the same dataclass.")
+
+        index = {
+            key: fill(map(getter, chunk), len(chunk), dtype)
+            for key, (getter, dtype) in index_getters.items()
+        }
+
+        dataframe = factory(
+            data={
+                key: fill(map(getter, chunk), len(chunk), dtype)
+                for key, (getter, dtype) in data_getters.items()
+            },
+            index=build_index(index),
+            columns=columns,
+        )
+
+        dataframe.attrs.update(attrs)
+        yield dataframe
+
+
+@overload
+def asframe_parallel(  # type: ignore
+    objs: Iterable[DataClassOf[TFrame, PAny]],
+    executor: Optional[Executor] = None,
+    *,
+    factory: None = None,
+    copy: Copy = True,
+) -> list[TFrame]: ...
+
+
+@overload
+def asframe_parallel(
+    objs: Iterable[DataClass[PAny]],
+    executor: Optional[Executor] = None,
+    *,
+    factory: Callable[..., TFrame],
+    copy: Copy = True,
+) -> list[TFrame]: ...
+
+
+@overload
+def asframe_parallel(
+    objs: Iterable[DataClass[PAny]],
+    executor: Optional[Executor] = None,
+    *,
+    factory: None = None,
+    copy: Copy = True,
+) -> list[pd.DataFrame]: ...
+
+
+def asframe_parallel(
+    objs: Iterable[Any],
+    executor: Optional[Executor] = None,
+    *,
+    factory: Any = None,
+    copy: Copy = True,
+) -> list[Any]:
+    """Create DataFrame objects from dataclass objects in parallel.
+
+    Each dataclass object is independently converted by ``asframe``
+    on an executor (a thread pool by default), which scales with
+    the number of threads as long as NumPy and pandas release the GIL
+    in data casting (or on free-threaded Python). Specifications of
+    the dataclasses are compiled in the calling thread beforehand.
+
+    Args:
+        objs: Dataclass objects that should have attribute, column,
+            data, and/or index fields. They may be of different
+            dataclasses unlike ``asframe_many``.
+        executor: Executor on which the dataclass objects are converted.
+            If not specified, a thread pool will be created and shut
+            down within the function call.
+
+    Keyword Args:
+        factory: Class or function for the DataFrame creation.
+            See ``asframe`` for more details.
+        copy: Copy mode of data. See ``asframe`` for more details.
+
+    Returns:
+        List of DataFrame objects in the same order as ``objs``.
+
+    Raises:
+        ValueError: Raised if data would be copied in the ``"never"``
+            copy mode.
+
+    """
+    objs = list(objs)
+
+    for dataclass in set(map(type, objs)):
+        Spec.from_dataclass(dataclass)
+
+    convert = partial(asframe, factory=factory, copy=copy)
+
+    if executor is not None:
+        return list(executor.map(convert, objs))
+
+    with ThreadPoolExecutor() as executor:
+        return list(executor.map(convert, objs))
+
+
+def concat(values: list[Any], dtype: Optional[str]) -> Any:
+    """Concatenate data and ensure it to have given data type."""
+    if all(isinstance(val, np.ndarray) for val in values):
+        return ensure(np.concatenate(values), dtype)
+    else:
+        return ensure(list(chain.from_iterable(values)), dtype)
+
+
+def equals(left: dict[Hashable, Any], right: dict[Hashable, Any]) -> bool:
+    """Check if two dictionaries have equal values (including arrays)."""
+    if left.keys() != right.keys():
+        return False
+
+    for key, val in left.items():
+        if val is right[key]:
+            continue
+
+        try:
+            if not np.array_equal(val, right[key]):
+                return False
+        except (TypeError, ValueError):
+            return False
+
+    return True
+
+
+def fill(values: Iterable[Any], count: int, dtype: Optional[str]) -> Any:
+    """Fill scalar values into an array preallocated with given data type.
+
+    Only fixed-width NumPy data types are preallocated (see ``get_fixed``).
+    Otherwise, values will be ensured to have the data type as a list.
+
+    """
+    if (np_dtype := get_fixed(dtype)) is not None:
+        return ensure(np.fromiter(values, np_dtype, count), dtype)
+    else:
+        return ensure(list(values), dtype)
+
+
+def get_fixed(dtype: Optional[str]) -> Optional[np.dtype]:
+    """Get a fixed-width NumPy data type of numbers or datetimes (if any)."""
+    if dtype is None:
+        return None
+
+    if not isinstance(np_dtype := pandas_dtype(dtype), np.dtype):
+        return None
+
+    return np_dtype if np_dtype.kind in "biufcmM" else None
+
+
+def gather(
+    values: dict[Hashable, Any],
+    buffers: dict[Hashable, list[Any]],
+    length: int,
+) -> None:
+    """Gather data of field items into lists with broadcasting."""
+    for key, val in values.items():
+        if not is_list_like(val):
+            val = [val] * length
+        elif len(val) == 1 and length != 1:
+            val = np.repeat(np.asarray(val), length)
+
+        buffers.setdefault(key, []).append(val)
+
+
+def get_itemsize(
+    getters: dict[Hashable, tuple[Callable[[Any], Any], Optional[str]]],
+) -> int:
+    """Estimate the number of bytes per row of field items."""
+    itemsize = 0
+
+    for _, dtype in getters.values():
+        if (np_dtype := get_fixed(dtype)) is not None:
+            itemsize += np_dtype.itemsize
+        else:
+            itemsize += np.dtype(object).itemsize
+
+    return max(itemsize, 1)
+
+
+def get_dtypes(fields: Fields) -> dict[Hashable, Optional[str]]:
+    """Derive data types of field items from field specifications."""
+    return {key: field.dtype for field in fields for key, _ in items(field)}
+
+
+def get_getters(
+    fields: Fields,
+) -> dict[Hashable, tuple[Callable[[Any], Any], Optional[str]]]:
+    """Derive value getters of field items from field specifications."""
+    getters: dict[Hashable, tuple[Callable[[Any], Any], Optional[str]]] = {}
+
+    for field in fields:
+        if field.has(Tag.MULTIPLE):
+            for key in field.default:
+                getters[key] = (get_item(field.id, key), field.dtype)
+        else:
+            getters[name(field)] = (attrgetter(field.id), field.dtype)
+
+    return getters
+
+
+def get_item(id: str, key: Hashable) -> Callable[[Any], Any]:
+    """Create a getter of an item of a multiple-item field."""
+    return lambda obj: getattr(obj, id)[key]
+
+
+def get_items(fields: Fields) -> dict[Hashable, Any]:
+    """Derive field items (loaded from paths if any) from field specifications."""
+    return {key: load(val) for key, val in chain.from_iterable(map(items, fields))}
+
+
+def get_length(values: Iterable[Any]) -> int:
+    """Return the common length of data, where length-one data are broadcast.
+
+    Raises:
+        ValueError: Raised if data have different lengths other than one.
+
+    """
+    sizes = set(map(size, values))
+
+    if len(sizes - {1}) > 1:
+        raise ValueError("Data and index must have the same length.")
+
+    return max(sizes, default=0)
+
+
+def size(data: Any) -> int:
+    """Return the number of elements of data as if it is 1D."""
+    return len(data) if is_list_like(data) else 1
@@ -0,0 +1,341 @@
+__all__ = ["CacheInfo", "cache_info", "clear_cache"]
+
+
+# standard library
+from collections import OrderedDict
+from itertools import count
+from threading import Lock, RLock
+from typing import Any, Callable, Hashable, NamedTuple, Optional, TypeVar
+from weakref import WeakKeyDictionary, ref
+
+
+# dependencies
+import numpy as np
+import pandas as pd
+
+
+# type hints
+TValue = TypeVar("TValue")
+
+
+# constants
+MISSING = object()
+"""Sentinel of missing cached values."""
+
+CLASS_MAXSIZE = 256
+"""Default maximum number of classes whose values are cached."""
+
+INDEX_MAXBYTES = 2**26
+"""Default maximum total bytes of cached indexes (64 MiB)."""
+
+VOCABULARIES: "WeakKeyDictionary[type, dict[Hashable, Vocabulary]]" = (
+    WeakKeyDictionary()
+)
+"""Vocabularies of fields of each dataclass."""
+
+
+class CacheInfo(NamedTuple):
+    """Statistics of a cache."""
+
+    hits: int
+    """Number of cache hits."""
+
+    misses: int
+    """Number of cache misses."""
+
+    evictions: int
+    """Number of evicted values."""
+
+    maxsize: Optional[int]
+    """Maximum number of cached values (``None`` if unbounded)."""
+
+    currsize: int
+    """Current number of cached values."""
+
+
+class ClassCache:
+    """Least-recently-used cache of values stored in classes.
+
+    Values are stored in the namespaces of classes (as an attribute of
+    a given name), so that they will be collected together with the
+    classes, while the cache holds only weak references to the classes
+    to evict the least-recently-used values beyond the size limit.
+
+    Recency of classes is tracked by stamps taken from a shared clock
+    (an atomic counter), so that a cache hit only stores a new stamp
+    of a class, and classes are sorted by their stamps only on eviction.
+
+    """
+
+    def __init__(self, name: str, maxsize: Optional[int] = CLASS_MAXSIZE) -> None:
+        self.name = name
+        self.maxsize = maxsize
+        self.misses = 0
+        self.evictions = 0
+        self.peeks = 0
+        self.clock = count()
+        self.classes: dict[int, "ref[type]"] = {}
+        self.stamps: dict[int, int] = {}
+        self.lock = RLock()
+
+    def __contains__(self, cls: type) -> bool:
+        """Check if a value of a class is cached."""
+        return self.name in vars(cls)
+
+    def __len__(self) -> int:
+        """Return the number of (alive) classes whose values are cached."""
+        with self.lock:
+            return sum(cls() is not None for cls in self.classes.values())
+
+    def get(self, cls: type, create: Callable[[type], TValue]) -> TValue:
+        """Get a cached value of a class (or create and cache it).
+
+        Creation is serialized by the lock of the cache, so that a value
+        of a class will never be created concurrently by many threads,
+        while a cached value is looked up without acquiring the lock
+        (a cache hit only stores a new recency stamp of the class).
+
+        """
+        if (value := vars(cls).get(self.name, MISSING)) is not MISSING:
+            return self.hit(cls, value)
+
+        with self.lock:
+            if (value := vars(cls).get(self.name, MISSING)) is not MISSING:
+                return self.hit(cls, value)
+
+            self.misses += 1
+            stamp = next(self.clock)
+            value = create(cls)
+
+            try:
+                setattr(cls, self.name, value)
+            except (AttributeError, TypeError):
+                return value
+
+            self.classes[id(cls)] = ref(cls)
+            self.stamps[id(cls)] = stamp
+            self.evict()
+            return value
+
+    def hit(self, cls: type, value: TValue) -> TValue:
+        """Count a cache hit and mark a class as most-recently used.
+
+        Each hit takes a stamp from the clock, so that the number
+        of hits is derived from the clock (see ``info``) without
+        a counter that would need the lock to be updated.
+
+        """
+        self.stamps[id(cls)] = next(self.clock)
+        return value
+
+    def evict(self) -> None:
+        """Evict values of dead or least-recently-used classes."""
+        with self.lock:
+            for key in [key for key, cls in self.classes.items() if cls() is None]:
+                del self.classes[key]
+
+            for key in self.stamps.keys() - self.classes.keys():
+                self.stamps.pop(key, None)
+
+            if self.maxsize is None or len(self.classes) <= self.maxsize:
+                return
+
+            keys = sorted(self.classes, key=lambda key: self.stamps.get(key, -1))
+
+            for key in keys[: len(keys) - self.maxsize]:
+                self.discard(self.classes.pop(key)())
+                self.stamps.pop(key, None)
+
+    def discard(self, cls: Optional[type]) -> None:
+        """Discard a cached value of a class (if any)."""
+        if cls is None or self.name not in vars(cls):
+            return
+
+        delattr(cls, self.name)
+        self.evictions += 1
+
+    def clear(self) -> None:
+        """Evict all cached values and reset the statistics."""
+        with self.lock:
+            while self.classes:
+                self.discard(self.classes.popitem()[1]())
+
+            self.stamps.clear()
+            self.clock = count()
+            self.misses = self.evictions = self.peeks = 0
+
+    def info(self) -> CacheInfo:
+        """Return the statistics of the cache.
+
+        The number of hits is that of stamps taken from the clock
+        except those taken by misses and by calls of this method.
+
+        """
+        with self.lock:
+            hits = next(self.clock) - self.misses - self.peeks
+            self.peeks += 1
+
+        return CacheInfo(
+            hits,
+            self.misses,
+            self.evictions,
+            self.maxsize,
+            len(self),
+        )
+
+
+SPEC_CACHE = ClassCache("__pandas_spec__")
+"""Cache of specifications of dataclasses."""
+
+CONVERTER_CACHE = ClassCache("__pandas_converters__")
+"""Cache of code-generated converters of dataclasses."""
+
+
+class IndexCache:
+    """Least-recently-used cache of indexes bounded by total bytes.
+
+    Indexes are cached by the identities of their (immutable) source
+    data, which are also held by the cache so that the identities will
+    never be reused while they are cached. Views of cached indexes are
+    returned, so that renaming an index never affects the others.
+
+    """
+
+    def __init__(self, maxbytes: int = INDEX_MAXBYTES) -> None:
+        self.maxbytes = maxbytes
+        self.nbytes = 0
+        self.entries: OrderedDict[Hashable, tuple[Any, "pd.Index[Any]"]]
+        self.entries = OrderedDict()
+        self.lock = RLock()
+
+    def __contains__(self, key: Hashable) -> bool:
+        """Check if an index of a key is cached."""
+        return key in self.entries
+
+    def __len__(self) -> int:
+        """Return the number of cached indexes."""
+        return len(self.entries)
+
+    def get(self, key: Hashable) -> Optional["pd.Index[Any]"]:
+        """Get a view of a cached index (or ``None`` if not cached)."""
+        with self.lock:
+            if (entry := self.entries.get(key)) is None:
+                return None
+
+            self.entries.move_to_end(key)
+            return entry[1].view()
+
+    def set(self, key: Hashable, sources: Any, index: "pd.Index[Any]") -> None:
+        """Cache an index with its source data (unless it is too large)."""
+        if (nbytes := index.nbytes) > self.maxbytes:
+            return
+
+        with self.lock:
+            if key in self.entries:
+                self.nbytes -= self.entries.pop(key)[1].nbytes
+
+            self.entries[key] = sources, index
+            self.nbytes += nbytes
+            self.evict()
+
+    def evict(self, nbytes: int = 0) -> None:
+        """Evict least-recently-used indexes until some bytes are free."""
+        with self.lock:
+            while self.entries and self.nbytes + nbytes > self.maxbytes:
+                self.nbytes -= self.entries.popitem(last=False)[1][1].nbytes
+
+    def clear(self) -> None:
+        """Evict all cached indexes."""
+        with self.lock:
+            self.entries.clear()
+            self.nbytes = 0
+
+
+INDEX_CACHE = IndexCache()
+"""Cache of indexes shared by conversions."""
+
+
+class Vocabulary:
+    """Categories of field data shared by conversions.
+
+    Data are encoded by looking up the categories, whose hash table is
+    built by pandas only once and reused as long as no new values are
+    found. New values are appended to the categories in the order of
+    their first appearance, so that codes of known values never change.
+
+    """
+
+    def __init__(self) -> None:
+        self.dtype = pd.CategoricalDtype(pd.Index([]))
+        self.lock = Lock()
+
+    def encode(self, data: Any) -> "pd.Categorical":
+        """Encode data as categorical data of the vocabulary."""
+        if isinstance(data, pd.Categorical):
+            data = data.to_numpy()
+
+        data = np.asarray(data if np.ndim(data) else [data])
+        values: "pd.Index[Any]" = pd.Index(data, copy=False)
+        categories: "pd.Index[Any]" = self.dtype.categories
+        codes = categories.get_indexer(values)
+
+        if (missing := (codes == -1) & ~pd.isna(values)).any():
+            with self.lock:
+                categories = self.extend(values[missing])
+                codes[missing] = categories.get_indexer(values[missing])
+
+        return pd.Categorical.from_codes(codes, dtype=self.dtype)
+
+    def extend(self, values: "pd.Index[Any]") -> "pd.Index[Any]":
+        """Append new values to the categories (if any)."""
+        categories: "pd.Index[Any]" = self.dtype.categories
+        new = pd.unique(values[categories.get_indexer(values) == -1])
+
+        if not len(new):
+            return categories
+
+        if len(categories):
+            categories = categories.append(pd.Index(new))
+        else:
+            categories = pd.Index(new)
+
+        self.dtype = pd.CategoricalDtype(categories)
+
+        return categories
+
+
+def get_vocabulary(dataclass: type, key: Hashable) -> Vocabulary:
+    """Get a vocabulary of a field (item) of a dataclass."""
+    vocabularies = VOCABULARIES.setdefault(dataclass, {})
+
+    if (vocabulary := vocabularies.get(key)) is None:
+        vocabulary = vocabularies.setdefault(key, Vocabulary())
+
+    return vocabulary
+
+
+def cache_info() -> dict[str, CacheInfo]:
+    """Return the statistics of the caches of dataclasses.
+
+    Returns:
+        Dictionary of the statistics of the caches of specifications
+        (``"spec"``) and code-generated converters (``"converter"``).
+        Their size limits can be changed by ``SPEC_CACHE.maxsize`` and
+        ``CONVERTER_CACHE.maxsize`` of ``pandas_dataclasses.core.cache``.
+
+    """
+    return {"spec": SPEC_CACHE.info(), "converter": CONVERTER_CACHE.info()}
+
+
+def clear_cache() -> None:
+    """Clear all caches of dataclasses, indexes, and vocabularies.
+
+    Cached specifications and converters of dataclasses, cached indexes,
+    and categorical vocabularies are all evicted, so that they will be
+    created again when dataclass objects are converted next time.
+
+    """
+    SPEC_CACHE.clear()
+    CONVERTER_CACHE.clear()
+    INDEX_CACHE.clear()
+    VOCABULARIES.clear()
@@ -0,0 +1,239 @@
+__all__ = ["from_frame", "from_frame_records"]
+
+
+# standard library
+from dataclasses import fields as fields_
+from functools import lru_cache
+from itertools import repeat
+from re import Pattern, compile, escape
+from string import Formatter
+from types import SimpleNamespace
+from typing import Any, Hashable, Iterable, Iterator, Optional
+
+
+# dependencies
+import pandas as pd
+from .api import name
+from .specs import Field, Fields, Spec, format
+from .tagging import Tag
+from .typing import TAny
+
+
+def from_frame(dataclass: type[TAny], frame: pd.DataFrame) -> TAny:
+    """Create a dataclass object from a DataFrame object.
+
+    This is the inverse of ``asframe``: values of data and index fields
+    will be the columns and the index levels of the DataFrame object,
+    and those of attribute fields will be the items of its attributes.
+    Values are taken by ``.values`` of pandas data, and thus they will
+    be views (no copy) of the DataFrame object wherever pandas allows.
+
+    If names of fields are format strings, values of the attributes
+    referenced in them (e.g. ``temp_unit`` of ``"Temp ({.temp_unit})"``)
+    will be extracted from the column names, index names, and keys of
+    attributes, and passed to the dataclass as strings.
+
+    Args:
+        dataclass: Dataclass that should have attribute, data,
+            and/or index fields.
+        frame: DataFrame object that complies with the dataclass.
+
+    Returns:
+        Dataclass object whose values are taken from the DataFrame object.
+
+    """
+    return dataclass(**get_kwargs(Spec.from_dataclass(dataclass), frame))
+
+
+def from_frame_records(dataclass: type[TAny], frame: pd.DataFrame) -> Iterator[TAny]:
+    """Create dataclass objects of each row of a DataFrame object.
+
+    This is the inverse of ``asframe_records``: each row of the DataFrame
+    object will become a dataclass object whose data and index fields
+    have scalar values. Each column and index level is converted into
+    a list at once, so that no Python loops over cells are involved.
+    Values of attribute fields (and attributes referenced in format
+    strings of field names) are shared by all dataclass objects.
+
+    Args:
+        dataclass: Dataclass that should have attribute, data,
+            and/or index fields with scalar values.
+        frame: DataFrame object that complies with the dataclass.
+
+    Yields:
+        Dataclass objects of each row of the DataFrame object.
+
+    """
+    spec = Spec.from_dataclass(dataclass)
+    kwargs = get_kwargs(spec, frame)
+    ids = {field.id for field in (*spec.data, *spec.index)}
+    values: list[Iterable[Any]] = []
+
+    for key, val in kwargs.items():
+        if key not in ids:
+            values.append(repeat(val))
+        elif isinstance(val, dict):
+            values.append(gen_dicts(val))  # type: ignore
+        else:
+            values.append(tolist(val))
+
+    for row in zip(*values):
+        yield dataclass(**dict(zip(kwargs.keys(), row)))
+
+
+def get_kwargs(spec: Spec, frame: pd.DataFrame) -> dict[str, Any]:
+    """Derive keyword arguments of a dataclass from a DataFrame object."""
+    if spec.origin is None:
+        raise ValueError("Could not find any original dataclass.")
+
+    columns: list[Hashable] = list(frame.columns)
+    levels: list[Hashable] = list(frame.index.names)
+    attrs: list[Hashable] = list(frame.attrs.keys())
+    values = extract(spec.data, columns) | extract(spec.index, levels)
+    values |= extract(spec.attrs, attrs)
+    obj = SimpleNamespace(**values)
+    kwargs: dict[str, Any] = {}
+
+    for field in sort(spec.data):
+        if field.has(Tag.MULTIPLE):
+            kwargs[field.id] = {key: frame[key].values for key in columns}
+        elif (key := resolve(field, obj)) in columns:
+            kwargs[field.id] = frame[key].values
+            columns.remove(key)
+
+    for field in sort(spec.index):
+        if field.has(Tag.MULTIPLE):
+            kwargs[field.id] = {
+                key: frame.index.get_level_values(key).values  # type: ignore
+                for key in levels
+            }
+        elif (key := resolve(field, obj)) in levels:
+            kwargs[field.id] = frame.index.get_level_values(key).values  # type: ignore
+            levels.remove(key)
+
+    for field in sort(spec.attrs):
+        if field.has(Tag.MULTIPLE):
+            kwargs[field.id] = {key: frame.attrs[key] for key in attrs}
+        elif (key := resolve(field, obj)) in attrs:
+            kwargs[field.id] = frame.attrs[key]
+            attrs.remove(key)
+
+    for field_ in fields_(spec.origin):
+        if field_.name in values:
+            kwargs.setdefault(field_.name, values[field_.name])
+
+    return {
+        f.name: kwargs[f.name]
+        for f in fields_(spec.origin)
+        if f.init and f.name in kwargs
+    }
+
+
+def extract(fields: Fields, labels: list[Hashable]) -> dict[str, str]:
+    """Extract attribute values referenced in names from labels."""
+    values: dict[str, str] = {}
+
+    for field in fields:
+        if field.has(Tag.MULTIPLE):
+            continue
+
+        for label in labels:
+            if (matched := match(field.name, label)) is not None:
+                values.update(matched)
+                break
+
+    return values
+
+
+def match(name: Any, label: Any) -> Optional[dict[str, str]]:
+    """Match a name with a label and extract attribute values if any."""
+    if isinstance(name, dict):
+        name = tuple(name.values())  # type: ignore
+
+    if isinstance(name, str):
+        if not isinstance(label, str):
+            return None
+
+        pattern, attrs = get_pattern(name)
+
+        if (matched := pattern.fullmatch(label)) is None:
+            return None
+
+        values: dict[str, str] = {}
+
+        for attr, value in zip(attrs, matched.groups()):
+            if attr is not None and values.setdefault(attr, value) != value:
+                return None
+
+        return values
+
+    if isinstance(name, (list, tuple)):
+        if not isinstance(label, tuple) or len(label) != len(name):  # type: ignore
+            return None
+
+        values = {}  # type: ignore
+
+        for matched in map(match, name, label):  # type: ignore
+            if matched is None:
+                return None
+
+            values.update(matched)
+
+        return values
+
+    return {} if name == label else None
+
+
+def gen_dicts(data: dict[Hashable, Any]) -> Iterator[dict[Hashable, Any]]:
+    """Generate dictionaries of each row from a dictionary of data."""
+    for row in zip(*map(tolist, data.values())):
+        yield dict(zip(data.keys(), row))
+
+
+@lru_cache(maxsize=256)
+def get_pattern(name: str) -> tuple[Pattern[str], list[Optional[str]]]:
+    """Convert a format string into a regular expression pattern."""
+    pattern = ""
+    attrs: list[Optional[str]] = []
+
+    for literal, field, _, _ in Formatter().parse(name):
+        pattern += escape(literal)
+
+        if field is None:
+            continue
+
+        pattern += "(.*?)"
+        attr = field.lstrip("0")
+
+        if attr.startswith(".") and attr[1:].isidentifier():
+            attrs.append(attr[1:])
+        else:
+            attrs.append(None)
+
+    return compile(pattern), attrs
+
+
+def resolve(field: Field, obj: Any) -> Hashable:
+    """Resolve the name of a field by an object (if possible)."""
+    try:
+        return name(Field(id=field.id, name=format(field.name, obj)))
+    except (AttributeError, IndexError, KeyError):
+        return name(field)
+
+
+def sort(fields: Fields) -> list[Field]:
+    """Sort field specifications so that multiple-item ones come last."""
+    return sorted(fields, key=lambda field: field.has(Tag.MULTIPLE))
+
+
+def tolist(data: Any) -> list[Any]:
+    """Convert data into a list of scalar values.
+
+    Datetimes and timedeltas will be converted into pandas scalars
+    (``Timestamp`` and ``Timedelta``) instead of integers of NumPy.
+
+    """
+    if not hasattr(data, "tolist"):
+        return list(data)
+
+    return pd.Index(data, copy=False, tupleize_cols=False).tolist()
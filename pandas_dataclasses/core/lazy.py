@@ -0,0 +1,263 @@
+__all__ = ["LazyFrame", "aslazyframe"]
+
+
+# standard library
+from functools import cached_property
+from typing import Any, Callable, Generic, Hashable, Iterator, Optional, cast, overload
+
+
+# dependencies
+import numpy as np
+import pandas as pd
+from .api import asframe, convert, get_attrs, get_columns, get_index, is_viewable
+from .api import items, load
+from .specs import Spec
+from .typing import Copy, DataClass, DataClassOf, PAny, TFrame
+
+
+# constants
+ATTRS = ("obj", "spec", "factory", "copy", "sources", "cache")
+"""Names of the instance attributes of a lazy DataFrame object."""
+
+
+def delegate(name: str) -> Callable[..., Any]:
+    """Create a method that delegates an operator to the whole DataFrame object."""
+
+    def method(self: Any, *args: Any) -> Any:
+        return getattr(self.frame, name)(*args)
+
+    method.__name__ = name
+    return method
+
+
+class LazyFrame(Generic[TFrame]):
+    """Proxy of a DataFrame object whose data are materialized lazily.
+
+    It holds a dataclass object and its updated specification, and
+    materializes each column only when it is accessed by ``[]`` and
+    the index only when it is first needed. Any other operation (e.g.
+    attribute access, ``repr``, arithmetic and comparison operators)
+    will materialize the whole DataFrame object by ``asframe`` once
+    and delegate the operation to it.
+
+    """
+
+    def __init__(
+        self,
+        obj: Any,
+        *,
+        factory: Optional[Callable[..., TFrame]] = None,
+        copy: Copy = True,
+    ) -> None:
+        self.obj = obj
+        self.spec = Spec.from_dataclass(obj.__class__) @ obj
+        self.factory = factory
+        self.copy: Copy = copy
+        self.sources = {
+            key: (val, field) for field in self.spec.data for key, val in items(field)
+        }
+        self.cache: dict[Hashable, "pd.Series[Any]"] = {}
+
+    @cached_property
+    def attrs(self) -> dict[Hashable, Any]:
+        """Attributes of the DataFrame object."""
+        return get_attrs(self.spec)
+
+    @cached_property
+    def columns(self) -> "pd.Index[Any]":
+        """Columns of the DataFrame object (without materializing data)."""
+        if (columns := get_columns(self.spec)) is None:
+            return pd.Index(list(self.sources), tupleize_cols=False)
+        else:
+            return columns
+
+    @cached_property
+    def frame(self) -> TFrame:
+        """DataFrame object whose data are all materialized."""
+        return asframe(self.obj, factory=self.factory, copy=self.copy)  # type: ignore
+
+    @cached_property
+    def index(self) -> "pd.Index[Any]":
+        """Index of the DataFrame object (materialized on first access)."""
+        if self.materialized:
+            return self.frame.index
+
+        if (index := get_index(self.spec)) is not None:
+            return index
+
+        if not self.sources:
+            return pd.RangeIndex(0)
+
+        return pd.RangeIndex(len(self.series(next(iter(self.sources)))))
+
+    @property
+    def materialized(self) -> bool:
+        """Whether the whole DataFrame object is materialized."""
+        return "frame" in self.__dict__
+
+    def __getitem__(self, key: Any) -> Any:
+        """Select a column (or columns) and materialize only them."""
+        if self.materialized:
+            return cast(Any, self.frame)[key]
+
+        if isinstance(key, list):
+            if all(self.__contains__(k) for k in key):  # type: ignore
+                return self.select(key)  # type: ignore
+
+            return self.frame[key]
+
+        if self.__contains__(key):
+            return self.series(key)
+
+        return cast(Any, self.frame)[key]
+
+    def __contains__(self, key: Any) -> bool:
+        """Check if a key is a (full) column name."""
+        try:
+            return key in self.sources
+        except TypeError:
+            return False
+
+    def __iter__(self) -> Iterator[Hashable]:
+        """Iterate over the column names."""
+        return iter(self.columns)
+
+    def __len__(self) -> int:
+        """Return the number of rows."""
+        return len(self.index)
+
+    def __array__(self, *args: Any, **kwargs: Any) -> np.ndarray:
+        """Convert the whole DataFrame object into an array."""
+        return self.frame.__array__(*args, **kwargs)
+
+    def __getattr__(self, name: str) -> Any:
+        """Delegate attribute access to the whole DataFrame object."""
+        if name.startswith("__") or name in vars(type(self)) or name in ATTRS:
+            raise AttributeError(name)
+
+        return getattr(self.frame, name)
+
+    def __repr__(self) -> str:
+        """Return the representation of the whole DataFrame object."""
+        return repr(self.frame)
+
+    # operators delegated to the whole DataFrame object
+    __add__ = delegate("__add__")
+    __radd__ = delegate("__radd__")
+    __sub__ = delegate("__sub__")
+    __rsub__ = delegate("__rsub__")
+    __mul__ = delegate("__mul__")
+    __rmul__ = delegate("__rmul__")
+    __truediv__ = delegate("__truediv__")
+    __rtruediv__ = delegate("__rtruediv__")
+    __floordiv__ = delegate("__floordiv__")
+    __rfloordiv__ = delegate("__rfloordiv__")
+    __mod__ = delegate("__mod__")
+    __rmod__ = delegate("__rmod__")
+    __pow__ = delegate("__pow__")
+    __rpow__ = delegate("__rpow__")
+    __matmul__ = delegate("__matmul__")
+    __rmatmul__ = delegate("__rmatmul__")
+    __and__ = delegate("__and__")
+    __rand__ = delegate("__rand__")
+    __or__ = delegate("__or__")
+    __ror__ = delegate("__ror__")
+    __xor__ = delegate("__xor__")
+    __rxor__ = delegate("__rxor__")
+    __eq__ = delegate("__eq__")
+    __ne__ = delegate("__ne__")
+    __lt__ = delegate("__lt__")
+    __le__ = delegate("__le__")
+    __gt__ = delegate("__gt__")
+    __ge__ = delegate("__ge__")
+    __neg__ = delegate("__neg__")
+    __pos__ = delegate("__pos__")
+    __abs__ = delegate("__abs__")
+    __invert__ = delegate("__invert__")
+
+    def select(self, keys: list[Hashable]) -> TFrame:
+        """Create a DataFrame object of selected columns."""
+        factory = self.factory or self.spec.factory or pd.DataFrame
+        positions = {key: i for i, key in enumerate(self.sources)}
+        columns = self.columns.take([positions[key] for key in keys])
+        data = {key: self.series(key) for key in keys}
+        dataframe = factory(data, index=self.index, columns=columns)
+        dataframe.attrs.update(self.attrs)
+        return dataframe  # type: ignore
+
+    def series(self, key: Hashable) -> "pd.Series[Any]":
+        """Create a Series object of a column (cached per column)."""
+        if (series := self.cache.get(key)) is not None:
+            return series
+
+        val, field = self.sources[key]
+
+        if self.copy == "never" and not is_viewable(val := load(val), field.dtype):
+            raise ValueError(f"Data {key!r} would be copied.")
+
+        if self.copy == "never" and field.id in self.spec.categorize:
+            raise ValueError(f"Data {key!r} would be copied.")
+
+        series = pd.Series(
+            convert(self.spec, field, key, val, self.copy),
+            index=self.index if self.spec.index else None,
+            name=key,
+            copy=self.copy is True,
+        )
+        series.attrs.update(self.attrs)
+        self.cache[key] = series
+        return series
+
+
+@overload
+def aslazyframe(  # type: ignore
+    obj: DataClassOf[TFrame, PAny],
+    *,
+    factory: None = None,
+    copy: Copy = True,
+) -> LazyFrame[TFrame]: ...
+
+
+@overload
+def aslazyframe(
+    obj: DataClass[PAny],
+    *,
+    factory: Callable[..., TFrame],
+    copy: Copy = True,
+) -> LazyFrame[TFrame]: ...
+
+
+@overload
+def aslazyframe(
+    obj: DataClass[PAny],
+    *,
+    factory: None = None,
+    copy: Copy = True,
+) -> LazyFrame[pd.DataFrame]: ...
+
+
+def aslazyframe(obj: Any, *, factory: Any = None, copy: Copy = True) -> Any:
+    """Create a lazy DataFrame object from a dataclass object.
+
+    Unlike ``asframe``, no data are converted until they are accessed:
+    ``lazy[key]`` (or ``lazy[[key, ...]]``) converts only the selected
+    columns, and ``lazy.index`` only the index. Any other operation
+    converts the whole DataFrame object once by ``asframe`` and is
+    delegated to it, which can be also obtained by ``lazy.frame``.
+
+    Args:
+        obj: Dataclass object that should have attribute, column, data,
+            and/or index fields. If the original dataclass has the
+            ``__pandas_factory__`` attribute, it will be used as a
+            factory for the DataFrame creation.
+
+    Keyword Args:
+        factory: Class or function for the DataFrame creation.
+            See ``asframe`` for more details.
+        copy: Copy mode of data. See ``asframe`` for more details.
+
+    Returns:
+        Lazy DataFrame object that complies with the original dataclass.
+
+    """
+    return LazyFrame(obj, factory=factory, copy=copy)
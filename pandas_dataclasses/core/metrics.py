@@ -0,0 +1,177 @@
+__all__ = ["clear_metrics", "enable_metrics", "get_metrics"]
+
+
+# standard library
+from threading import Lock
+from time import perf_counter
+from typing import Any
+
+
+# dependencies
+import pandas as pd
+
+
+# constants
+PHASES: tuple[str, ...] = (
+    "spec",
+    "names",
+    "data",
+    "index",
+    "columns",
+    "factory",
+    "codegen",
+)
+"""Phases of a conversion whose time spent is recorded."""
+
+
+class Timer:
+    """Timer of the phases of a conversion of a dataclass object."""
+
+    def __init__(self, metrics: "Metrics", dataclass: type) -> None:
+        self.metrics = metrics
+        self.dataclass = dataclass
+        self.times = dict.fromkeys(PHASES, 0.0)
+        self.last = perf_counter()
+
+    def lap(self, phase: str) -> None:
+        """Add the time spent since the last lap to a phase."""
+        self.times[phase] += (now := perf_counter()) - self.last
+        self.last = now
+
+    def stop(self, data: Any) -> Any:
+        """Record the times of the phases and the bytes of pandas data."""
+        self.metrics.record(self.dataclass, self.times, get_nbytes(data))
+        return data
+
+
+class NullTimer(Timer):
+    """Timer that records nothing (used while metrics are disabled)."""
+
+    def __init__(self) -> None:
+        pass
+
+    def lap(self, phase: str) -> None:
+        """Do nothing."""
+
+    def stop(self, data: Any) -> Any:
+        """Return pandas data as they are."""
+        return data
+
+
+class Metrics:
+    """Call counts and time spent in conversions of each dataclass.
+
+    Metrics are recorded only while they are enabled. Otherwise, a
+    conversion will get a timer that does nothing, so that the cost
+    of instrumentation is only a few method calls per conversion.
+
+    """
+
+    def __init__(self) -> None:
+        self.enabled = False
+        self.records: dict[str, dict[str, Any]] = {}
+        self.lock = Lock()
+
+    def timer(self, dataclass: type) -> Timer:
+        """Start a timer of a conversion of a dataclass object."""
+        return Timer(self, dataclass) if self.enabled else NULL_TIMER
+
+    def record(self, dataclass: type, times: dict[str, float], nbytes: int) -> None:
+        """Record the times and the bytes of a conversion."""
+        with self.lock:
+            record = self.get(dataclass)
+            record["calls"] += 1
+            record["bytes"] += nbytes
+
+            record_times: dict[str, float] = record["time"]
+
+            for phase, time in times.items():
+                record_times[phase] += time
+
+    def save(self, dataclass: type, nbytes: int) -> None:
+        """Record the bytes saved by downcasting data in a conversion."""
+        with self.lock:
+            self.get(dataclass)["saved"] += nbytes
+
+    def get(self, dataclass: type) -> dict[str, Any]:
+        """Get (or create) the record of a dataclass (with the lock held)."""
+        key = f"{dataclass.__module__}.{dataclass.__qualname__}"
+
+        if (record := self.records.get(key)) is None:
+            record = self.records[key] = {
+                "calls": 0,
+                "bytes": 0,
+                "saved": 0,
+                "time": dict.fromkeys(PHASES, 0.0),
+            }
+
+        return record
+
+    def snapshot(self) -> dict[str, dict[str, Any]]:
+        """Return a copy of the records."""
+        with self.lock:
+            return {
+                key: {**record, "time": dict(record["time"])}
+                for key, record in self.records.items()
+            }
+
+    def clear(self) -> None:
+        """Clear the records."""
+        with self.lock:
+            self.records.clear()
+
+
+METRICS = Metrics()
+"""Metrics of conversions shared by the package."""
+
+NULL_TIMER = NullTimer()
+"""Timer used while metrics are disabled."""
+
+
+def clear_metrics() -> None:
+    """Clear the metrics of conversions recorded so far."""
+    METRICS.clear()
+
+
+def enable_metrics(enabled: bool = True) -> None:
+    """Enable (or disable) the metrics of conversions.
+
+    While they are enabled, ``asframe``, ``asseries``, and ``aspandas``
+    record call counts, time spent in each phase of conversions, bytes
+    of created pandas data, and bytes saved by downcasting data per
+    dataclass (see ``get_metrics``).
+
+    Args:
+        enabled: Whether the metrics should be recorded.
+
+    """
+    METRICS.enabled = enabled
+
+
+def get_metrics() -> dict[str, dict[str, Any]]:
+    """Return a snapshot of the metrics of conversions.
+
+    Returns:
+        Dictionary of the metrics of each dataclass (keyed by its full
+        name). Each of them has the number of calls (``"calls"``), the
+        total bytes of created pandas data (``"bytes"``), the total bytes
+        saved by the downcast policy (``"saved"``), and the total seconds
+        spent in each phase (``"time"``): specification lookup
+        (``"spec"``), binding and name formatting (``"names"``), data
+        conversion (``"data"``), index building (``"index"``), column
+        building (``"columns"``), factory call (``"factory"``), and
+        code-generated conversion as a whole (``"codegen"``).
+
+    """
+    return METRICS.snapshot()
+
+
+def get_nbytes(data: Any) -> int:
+    """Get the bytes of pandas data (including index) without inspecting objects."""
+    if isinstance(data, pd.DataFrame):
+        return int(data.memory_usage(deep=False).sum())
+
+    if isinstance(data, pd.Series):
+        return int(data.memory_usage(deep=False))
+
+    return 0
@@ -0,0 +1,283 @@
+__all__ = ["asframe_shared"]
+
+
+# standard library
+import sys
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import dataclass
+from itertools import accumulate
+from multiprocessing.shared_memory import SharedMemory
+from os import cpu_count
+from typing import Any, Callable, Hashable, Iterable, Optional, Sequence, cast, overload
+from weakref import finalize
+
+
+# dependencies
+import numpy as np
+import pandas as pd
+from pandas.api.types import pandas_dtype
+from .api import build_index, ensure, get_attrs, get_columns, load, name, split
+from .batch import equals, get_items, get_length
+from .specs import Fields, Spec
+from .tagging import Tag
+from .typing import DataClass, DataClassOf, PAny, TFrame
+
+
+class Memory(SharedMemory):
+    """Shared-memory buffer that can be closed while it is exported.
+
+    Closing it while arrays over it are alive will be deferred (i.e.
+    nothing happens) instead of raising ``BufferError``, so that the
+    buffer will be unmapped when the last array over it is deleted.
+
+    """
+
+    def close(self) -> None:
+        """Close the buffer unless arrays over it are alive."""
+        try:
+            super().close()
+        except BufferError:
+            pass
+
+
+@dataclass(frozen=True)
+class Slot:
+    """Layout of a field item in a shared-memory buffer."""
+
+    id: str
+    """Identifier of the field."""
+
+    key: Optional[Hashable]
+    """Key of the item (only for multiple-item fields)."""
+
+    dtype: str
+    """Data type of the item (fixed-width NumPy data type)."""
+
+    memory: str
+    """Name of the shared-memory buffer."""
+
+    def get(self, obj: Any) -> Any:
+        """Get the value of the item (loaded from a path if any) of an object."""
+        if self.key is None:
+            return load(getattr(obj, self.id))
+        else:
+            return load(dict(split(getattr(obj, self.id)))[self.key])
+
+
+@overload
+def asframe_shared(
+    objs: Iterable[DataClassOf[TFrame, PAny]],
+    executor: Optional[Executor] = None,
+    *,
+    factory: None = None,
+    workers: Optional[int] = None,
+) -> TFrame: ...
+
+
+@overload
+def asframe_shared(
+    objs: Iterable[DataClass[PAny]],
+    executor: Optional[Executor] = None,
+    *,
+    factory: Callable[..., TFrame],
+    workers: Optional[int] = None,
+) -> TFrame: ...
+
+
+@overload
+def asframe_shared(
+    objs: Iterable[DataClass[PAny]],
+    executor: Optional[Executor] = None,
+    *,
+    factory: None = None,
+    workers: Optional[int] = None,
+) -> pd.DataFrame: ...
+
+
+def asframe_shared(
+    objs: Iterable[Any],
+    executor: Optional[Executor] = None,
+    *,
+    factory: Any = None,
+    workers: Optional[int] = None,
+) -> Any:
+    """Create a DataFrame object from dataclass objects on processes.
+
+    This is the multi-process version of ``asframe_many``: the layout
+    of shared-memory buffers of data and index is computed once from
+    the specification of the dataclass in the calling process, and
+    worker processes cast data of chunks of the dataclass objects into
+    the buffers. The DataFrame object is then created over the buffers
+    without copying, and they will be released when it is deleted.
+    Data and index of all fields must have fixed-width NumPy data types.
+
+    Args:
+        objs: Dataclass objects of the same dataclass that should have
+            the same column names and attributes. They (and the dataclass)
+            must be picklable. If the original dataclass has the
+            ``__pandas_factory__`` attribute, it will be used as a
+            factory for the DataFrame creation.
+        executor: Executor on which the chunks are processed.
+            If not specified, a process pool will be created and
+            shut down within the function call.
+
+    Keyword Args:
+        factory: Class or function for the DataFrame creation.
+            See ``asframe_many`` for more details.
+        workers: Number of chunks into which the dataclass objects
+            are split (and of processes of the default process pool).
+            If not specified, the number of CPUs will be used.
+
+    Returns:
+        DataFrame object that complies with the original dataclass.
+
+    Raises:
+        TypeError: Raised if the dataclass objects are not of the same
+            dataclass.
+        ValueError: Raised if no dataclass object is given, column names
+            or attributes differ between the dataclass objects, data and
+            index of any of them have different lengths, or any data type
+            is not a fixed-width NumPy data type.
+
+    """
+    if not (objs := list(objs)):
+        raise ValueError("Could not find any dataclass object.")
+
+    spec = Spec.from_dataclass(objs[0].__class__)
+    first_spec = spec @ objs[0]
+    attrs = get_attrs(first_spec)
+    index_keys = get_items(first_spec.index).keys()
+    data_keys = get_items(first_spec.data).keys()
+    lengths: list[int] = []
+
+    for obj in objs:
+        if type(obj) is not spec.origin:
+            raise TypeError("Dataclass objects must be of the same dataclass.")
+
+        if not equals(get_attrs(obj_spec := spec @ obj), attrs):
+            raise ValueError("Attributes must be the same.")
+
+        index_items = get_items(obj_spec.index)
+        data_items = get_items(obj_spec.data)
+
+        if index_items.keys() != index_keys:
+            raise ValueError("Index names must be the same.")
+
+        if data_items.keys() != data_keys:
+            raise ValueError("Column names must be the same.")
+
+        lengths.append(get_length([*index_items.values(), *data_items.values()]))
+
+    offsets = [0, *accumulate(lengths)]
+    memories: dict[Hashable, Memory] = {}
+
+    try:
+        index_slots = get_slots(first_spec.index, offsets[-1], memories)
+        data_slots = get_slots(first_spec.data, offsets[-1], memories)
+        slots = {**index_slots, **data_slots}
+        workers = workers or cpu_count() or 1
+        step = -(-len(objs) // workers)
+        chunks = [
+            (objs[i : i + step], offsets[i : i + step + 1], slots)
+            for i in range(0, len(objs), step)
+        ]
+
+        if executor is not None:
+            list(executor.map(fill_shared, *zip(*chunks)))
+        else:
+            with ProcessPoolExecutor(workers) as executor:
+                list(executor.map(fill_shared, *zip(*chunks)))
+    except BaseException:
+        for memory in memories.values():
+            memory.close()
+
+        raise
+    finally:
+        for memory in memories.values():
+            memory.unlink()
+
+    arrays = {
+        key: share(memories[key], offsets[-1], slot.dtype)
+        for key, slot in slots.items()
+    }
+
+    if factory is None:
+        factory = spec.factory or pd.DataFrame
+
+    dataframe = factory(
+        data={key: ensure(arrays[key], slots[key].dtype) for key in data_slots},
+        index=build_index({key: arrays[key] for key in index_slots}),
+        columns=get_columns(first_spec),
+        copy=False,
+    )
+
+    dataframe.attrs.update(attrs)
+    return dataframe
+
+
+def attach(name: str) -> Memory:
+    """Attach to a shared-memory buffer without tracking it (if possible)."""
+    if sys.version_info >= (3, 13):
+        return Memory(name, track=False)  # type: ignore
+    else:
+        return Memory(name)
+
+
+def fill_shared(
+    objs: Sequence[Any],
+    offsets: Sequence[int],
+    slots: dict[Hashable, Slot],
+) -> None:
+    """Cast data of dataclass objects into shared-memory buffers."""
+    for slot in slots.values():
+        memory = attach(slot.memory)
+        buffer: Any = np.frombuffer(memory.buf, slot.dtype, offsets[-1])  # type: ignore
+
+        try:
+            for obj, start, stop in zip(objs, offsets, offsets[1:]):
+                buffer[start:stop] = ensure(slot.get(obj), slot.dtype)
+        finally:
+            del buffer
+            memory.close()
+
+
+def get_slots(
+    fields: Fields,
+    length: int,
+    memories: dict[Hashable, Memory],
+) -> dict[Hashable, Slot]:
+    """Allocate shared-memory buffers of field items and derive their layout."""
+    slots: dict[Hashable, Slot] = {}
+
+    for field in fields:
+        if field.has(Tag.MULTIPLE):
+            keys = [(key, key) for key, _ in split(field.default)]
+        else:
+            keys = [(name(field), None)]
+
+        for key, item in keys:
+            if field.dtype is None:
+                raise ValueError(f"Data type of {key!r} must be specified.")
+
+            dtype = pandas_dtype(field.dtype)
+
+            if not isinstance(dtype, np.dtype) or dtype.kind not in "biufcmM":
+                raise ValueError(f"Data type of {key!r} must be fixed-width.")
+
+            memory = Memory(create=True, size=max(length * dtype.itemsize, 1))
+            memories[key] = memory
+            slots[key] = Slot(field.id, item, field.dtype, memory.name)
+
+    return slots
+
+
+def share(memory: Memory, length: int, dtype: str) -> np.ndarray:
+    """Create an array over a shared-memory buffer that owns the buffer.
+
+    The buffer will be closed when the array (and all views of it)
+    is deleted, so that it will live as long as pandas data over it.
+
+    """
+    array = np.frombuffer(cast(memoryview, memory.buf), np.dtype(dtype), length)
+    finalize(cast(np.ndarray, array.base), memory.close)
+    return array
@@ -2,17 +2,19 @@ __all__ = ["Spec"]
 
 
 # standard library
-from dataclasses import Field as Field_, dataclass, fields as fields_, replace
-from functools import lru_cache
+from dataclasses import Field as Field_, dataclass, fields as fields_
+from functools import cached_property
 from itertools import repeat
 from typing import Any, Callable, Hashable, Literal, Optional, Union
 
 
 # dependencies
+import numpy as np
 from pandas.api.types import pandas_dtype
 from typing_extensions import Self, get_args, get_origin, get_type_hints
+from .cache import SPEC_CACHE
 from .tagging import Tag, get_nontags, get_tagged, get_tags
-from .typing import HashDict, Pandas, TAny, is_union
+from .typing import Downcast, Engine, HashDict, Pandas, TAny, is_union
 
 
 @dataclass(frozen=True)
@@ -37,29 +39,76 @@ class Field:
     default: Any = None
     """Default value of the field data."""
 
+    @cached_property
+    def mask(self) -> int:
+        """Integer bitmask of the tags of the field."""
+        return Tag.union(self.tags).value
+
+    @cached_property
+    def dynamic(self) -> bool:
+        """Whether the name of the field has format placeholders."""
+        return is_dynamic(self.name)
+
     def has(self, tag: Tag) -> bool:
         """Check if the specification has a tag."""
-        return bool(tag & Tag.union(self.tags))
+        return bool(tag.value & self.mask)
 
     def update(self, obj: Any) -> Self:
-        """Update the specification by an object."""
-        return replace(
-            self,
-            name=format(self.name, obj),
-            default=getattr(obj, self.id, self.default),
-        )
+        """Update the specification by an object.
+
+        Unlike ``dataclasses.replace``, this copies the attributes
+        of the specification (including the precomputed ones) as they
+        are and only replaces the default value and the name (if it has
+        format placeholders) without any validation by ``__init__``.
+
+        """
+        values = self.__dict__.copy()
+        values["default"] = getattr(obj, self.id, self.default)
+
+        if self.dynamic:
+            values["name"] = format(self.name, obj)
+
+        field = object.__new__(type(self))
+        field.__dict__.update(values)
+        return field
 
 
 class Fields(tuple[Field, ...]):
     """List of field specifications with selectors."""
 
+    @cached_property
+    def positions(self) -> dict[int, tuple[int, ...]]:
+        """Positions of fields selected by each tag (as a bitmask)."""
+        return {}
+
+    @cached_property
+    def selections(self) -> dict[int, Self]:
+        """Fields selected by each tag (as a bitmask)."""
+        return {}
+
     def of(self, tag: Tag) -> Self:
-        """Select only fields that have a tag."""
-        return type(self)(filter(lambda field: field.has(tag), self))
+        """Select only fields that have a tag.
+
+        Positions of the selected fields are computed only once and
+        shared with the updated specifications, and the selected fields
+        are also cached, so that a selection costs O(1) after the first.
+
+        """
+        if (selection := self.selections.get(mask := tag.value)) is not None:
+            return selection
+
+        if (positions := self.positions.get(mask)) is None:
+            positions = tuple(i for i, field in enumerate(self) if field.mask & mask)
+            self.positions[mask] = positions
+
+        selection = self.selections[mask] = type(self)(map(self.__getitem__, positions))
+        return selection
 
     def update(self, obj: Any) -> Self:
         """Update the specifications by an object."""
-        return type(self)(field.update(obj) for field in self)
+        fields = type(self)(field.update(obj) for field in self)
+        fields.__dict__["positions"] = self.positions
+        return fields
 
 
 @dataclass(frozen=True)
@@ -78,15 +127,81 @@ class Spec:
     fields: Fields = Fields()
     """List of field specifications."""
 
+    engine: Optional[Engine] = None
+    """Engine for pandas data creation."""
+
+    categorize: tuple[str, ...] = ()
+    """Identifiers of fields to be encoded as categorical data."""
+
+    downcast: Optional[Downcast] = None
+    """Downcast policy of data of untyped data fields."""
+
+    @cached_property
+    def attrs(self) -> Fields:
+        """List of attribute field specifications."""
+        return self.fields.of(Tag.ATTR)
+
+    @cached_property
+    def data(self) -> Fields:
+        """List of data field specifications."""
+        return self.fields.of(Tag.DATA)
+
+    @cached_property
+    def index(self) -> Fields:
+        """List of index field specifications."""
+        return self.fields.of(Tag.INDEX)
+
+    @cached_property
+    def dtype(self) -> Optional[str]:
+        """Common numeric data type of data fields (if any).
+
+        It will be ``None`` if there are no data fields, any of them
+        is a multiple-item field, or they have different data types.
+
+        """
+        if not (dtypes := {field.dtype for field in self.data}):
+            return None
+
+        if len(dtypes) != 1 or any(field.has(Tag.MULTIPLE) for field in self.data):
+            return None
+
+        if (dtype := dtypes.pop()) is None:
+            return None
+
+        if not isinstance(np_dtype := pandas_dtype(dtype), np.dtype):
+            return None
+
+        if np_dtype.kind not in "biufc":
+            return None
+
+        return dtype
+
     @classmethod
     def from_dataclass(cls, dataclass: type) -> Self:
-        """Create a specification from a data class."""
+        """Create a specification from a data class.
+
+        Specifications are cached in data classes by ``SPEC_CACHE``
+        (up to 256 classes with the least-recently-used eviction), so
+        that they will be compiled only once even if they are used in
+        many conversions, and collected together with the data classes.
+        Compilation is serialized by the lock of the cache, so that field
+        types of a data class are never evaluated concurrently.
+
+        """
+        return SPEC_CACHE.get(dataclass, cls.compile)
+
+    @classmethod
+    def compile(cls, dataclass: type) -> Self:
+        """Compile a specification from a data class (without caching)."""
         eval_field_types(dataclass)
 
         return cls(
             name=dataclass.__name__,
             origin=dataclass,
             factory=getattr(dataclass, "__pandas_factory__", None),
+            engine=getattr(dataclass, "__pandas_engine__", None),
+            categorize=tuple(getattr(dataclass, "__pandas_categorize__", ())),
+            downcast=getattr(dataclass, "__pandas_downcast__", None),
             fields=Fields(map(convert_field, fields_(dataclass))),
         )
 
@@ -96,17 +211,33 @@ class Spec:
             if not isinstance(obj, self.origin):
                 obj = self.origin(obj)
 
-        return replace(self, fields=self.fields.update(obj))
+        spec = object.__new__(type(self))
+        spec.__dict__.update(
+            name=self.name,
+            origin=self.origin,
+            factory=self.factory,
+            fields=self.fields.update(obj),
+            engine=self.engine,
+            categorize=self.categorize,
+            downcast=self.downcast,
+        )
+
+        spec.__dict__["dtype"] = self.dtype
+        return spec
 
     def __matmul__(self, obj: Any) -> Self:
         """Alias of the update method."""
         return self.update(obj)
 
 
-@lru_cache(maxsize=None)
 def convert_field(field_: Field_[Any]) -> Field:
-    """Convert a dataclass field to a field specification."""
-    return Field(
+    """Convert a dataclass field to a field specification.
+
+    Tag bitmask and placeholder detection of the name are precomputed,
+    so that they will be shared by all updated specifications.
+
+    """
+    field = Field(
         id=field_.name,
         name=get_first(field_.type, field_.name),
         tags=get_tags(field_.type, Tag.FIELD),
@@ -114,9 +245,10 @@ def convert_field(field_: Field_[Any]) -> Field:
         dtype=get_dtype(field_.type),
         default=field_.default,
     )
+    _ = field.mask, field.dynamic
+    return field
 
 
-@lru_cache(maxsize=None)
 def eval_field_types(dataclass: type) -> None:
     """Evaluate field types of a dataclass."""
     types = get_type_hints(dataclass, include_extras=True)
@@ -139,6 +271,20 @@ def format(obj: TAny, by: Any) -> TAny:
     return obj
 
 
+def is_dynamic(obj: Any) -> bool:
+    """Check if a string or nested strings in an object have placeholders."""
+    if isinstance(obj, str):
+        return "{" in obj or "}" in obj
+
+    if isinstance(obj, (list, tuple)):
+        return any(map(is_dynamic, obj))  # type: ignore
+
+    if isinstance(obj, dict):
+        return any(map(is_dynamic, obj.items()))  # type: ignore
+
+    return False
+
+
 def get_dtype(tp: Any) -> Optional[str]:
     """Extract a data type of NumPy or pandas from a type hint."""
     if (tp := get_tagged(tp, Tag.DATA | Tag.INDEX, True)) is None:
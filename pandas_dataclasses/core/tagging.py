@@ -39,8 +39,13 @@ class Tag(Flag):
 
     def annotates(self, tp: Any) -> bool:
         """Check if the tag annotates a type hint."""
-        tags = filter(type(self).creates, get_args(tp))
-        return bool(self & type(self).union(tags))
+        mask = self.value
+
+        for tag in filter(type(self).creates, get_args(tp)):
+            if tag.value & mask:
+                return True
+
+        return False
 
     @classmethod
     def creates(cls, obj: Any) -> TypeGuard[Self]:
@@ -1,6 +1,9 @@
 __all__ = [
+    "Copy",
     "DataClass",
     "DataClassOf",
+    "Downcast",
+    "Engine",
     "HashDict",
     "Pandas",
     "PAny",
@@ -15,7 +18,16 @@ __all__ = [
 # standard library
 import types
 from dataclasses import Field
-from typing import Any, Callable, ClassVar, Hashable, Protocol, TypeVar, Union
+from typing import (
+    Any,
+    Callable,
+    ClassVar,
+    Hashable,
+    Literal,
+    Protocol,
+    TypeVar,
+    Union,
+)
 
 
 # dependencies
@@ -23,6 +35,15 @@ from pandas import DataFrame, Series
 from typing_extensions import ParamSpec, get_origin
 
 
+Copy = Union[bool, Literal["never"]]
+"""Type hint for copy modes of data (``True``, ``False``, or ``"never"``)."""
+
+Downcast = Literal["safe"]
+"""Type hint for downcast policies of data (``"safe"``)."""
+
+Engine = Literal["codegen", "generic"]
+"""Type hint for conversion engines (``"codegen"`` or ``"generic"``)."""
+
 HashDict = dict[Hashable, Hashable]
 """Type hint for dictionary of hashable keys and values."""
 
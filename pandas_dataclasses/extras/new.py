@@ -2,58 +2,167 @@ __all__ = ["As", "AsFrame", "AsSeries"]
 
 
 # standard library
-from inspect import signature
+from inspect import Parameter, Signature, signature
 from types import MethodType
-from typing import Any, Callable, ForwardRef, Generic, Union
+from typing import Any, Callable, ForwardRef, Generic, Iterable, Union
 
 
 # dependencies
 import pandas as pd
 from typing_extensions import get_args, get_origin
-from ..core.api import aspandas
-from ..core.typing import DataClassOf, PAny, TPandas
+from ..core.api import aspandas, get_kind
+from ..core.batch import asframe_many, asframe_records
+from ..core.typing import DataClassOf, Downcast, Engine, PAny, TFrame, TPandas
 
 
 class classproperty:
-    """Class property decorator dedicated to ``As.new``."""
+    """Class property decorator dedicated to ``As.new``.
+
+    A classmethod returned by the decorated function is cached in the
+    class namespace (as ``__pandas_<name>__``) on first access, so that
+    it will be built only once per class and reused afterwards.
+
+    """
 
     def __init__(self, fget: Callable[..., Any]) -> None:
         self.fget = fget
 
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.name = f"__pandas_{name}__"
+
     def __get__(
         self,
         obj: Any,
         cls: type[DataClassOf[TPandas, PAny]],
     ) -> Callable[PAny, TPandas]:
-        return self.fget(cls)  # type: ignore
+        return get_cached(cls, self.name, self.fget)
+
+
+class batchproperty(classproperty):
+    """Class property decorator dedicated to ``As.new_many`` and others.
+
+    Since batch creation always creates a DataFrame object, it is not
+    available (i.e. ``AttributeError`` will be raised) for classes
+    whose factories do not create DataFrame objects (e.g. ``AsSeries``).
+
+    """
+
+    def __get__(  # type: ignore
+        self,
+        obj: Any,
+        cls: type[DataClassOf[TFrame, PAny]],
+    ) -> Callable[[Iterable[Any]], TFrame]:
+        kind = get_kind(cls.__pandas_factory__)
+
+        if not isinstance(kind, type) or not issubclass(kind, pd.DataFrame):
+            raise AttributeError(
+                f"{cls.__name__} does not create DataFrame objects,"
+                " so batch creation is not available."
+            )
+
+        return get_cached(cls, self.name, self.fget)
 
 
 class As(Generic[TPandas]):
-    """Pandas data creation by a classmethod (``new``)."""
+    """Pandas data creation by classmethods (``new`` and others)."""
 
     __pandas_factory__: Callable[..., TPandas]
     """Factory for pandas data creation."""
 
+    __pandas_engine__: Engine
+    """Engine for pandas data creation."""
+
+    __pandas_categorize__: Iterable[str]
+    """Identifiers of fields to be encoded as categorical data."""
+
+    __pandas_downcast__: Downcast
+    """Downcast policy of data of untyped data fields."""
+
     def __init_subclass__(cls, **kwargs: Any) -> None:
-        """Add a pandas factory to an inheriting class."""
+        """Add a pandas factory (and options) to an inheriting class."""
         factory = kwargs.pop("factory", None)
+        engine = kwargs.pop("engine", None)
+        categorize = kwargs.pop("categorize", None)
+        downcast = kwargs.pop("downcast", None)
         cls.__pandas_factory__ = factory or get_factory(cls)
+
+        if categorize is not None:
+            cls.__pandas_categorize__ = tuple(categorize)
+
+        if engine is not None:
+            if engine not in get_args(Engine):
+                raise ValueError(f"Engine must be one of {get_args(Engine)}.")
+
+            cls.__pandas_engine__ = engine
+
+        if downcast is not None:
+            if downcast not in get_args(Downcast):
+                raise ValueError(f"Downcast must be one of {get_args(Downcast)}.")
+
+            cls.__pandas_downcast__ = downcast
+
         super().__init_subclass__(**kwargs)
 
     @classproperty
     def new(cls) -> MethodType:
-        """Return a classmethod for pandas data creation."""
+        """Return a classmethod for pandas data creation.
+
+        In addition to the dataclass arguments, it accepts ``columns``
+        and ``exclude`` as keyword-only arguments for the projection of
+        data fields (see ``asframe``) unless they are dataclass fields.
 
+        """
         sig = signature(cls.__init__)  # type: ignore
-        sig = sig.replace(return_annotation=get_return(cls))
+        params = list(sig.parameters.values())
+        options: list[str] = []
+
+        for option in ("columns", "exclude"):
+            if option not in sig.parameters:
+                params.append(Parameter(option, Parameter.KEYWORD_ONLY, default=None))
+                options.append(option)
+
+        sig = sig.replace(parameters=params, return_annotation=get_return(cls))
 
         def new(cls: Any, *args: Any, **kwargs: Any) -> Any:
             """Create a pandas data from dataclass arguments."""
-            return aspandas(cls(*args, **kwargs))
+            projection = {option: kwargs.pop(option, None) for option in options}
+            return aspandas(cls(*args, **kwargs), **projection)
 
         setattr(new, "__signature__", sig)
         return MethodType(new, cls)
 
+    @batchproperty
+    def new_many(cls) -> MethodType:
+        """Return a classmethod for pandas data creation from objects.
+
+        The pandas data will be a DataFrame object (or its subclass)
+        created by ``asframe_many`` with the factory of the class.
+
+        """
+
+        def new_many(cls: Any, objs: Iterable[Any]) -> Any:
+            """Create a pandas data from dataclass objects of the class."""
+            return asframe_many(objs, factory=cls.__pandas_factory__)
+
+        setattr(new_many, "__signature__", get_batch_signature(cls))
+        return MethodType(new_many, cls)
+
+    @batchproperty
+    def new_records(cls) -> MethodType:
+        """Return a classmethod for pandas data creation from records.
+
+        The pandas data will be a DataFrame object (or its subclass)
+        created by ``asframe_records`` with the factory of the class.
+
+        """
+
+        def new_records(cls: Any, objs: Iterable[Any]) -> Any:
+            """Create a pandas data from records of dataclass objects."""
+            return asframe_records(objs, factory=cls.__pandas_factory__)
+
+        setattr(new_records, "__signature__", get_batch_signature(cls))
+        return MethodType(new_records, cls)
+
 
 AsFrame = As[pd.DataFrame]
 """Alias of ``As[pandas.DataFrame]``."""
@@ -63,6 +172,21 @@ AsSeries = As["pd.Series[Any]"]
 """Alias of ``As[pandas.Series[Any]]``."""
 
 
+def get_batch_signature(cls: Any) -> Signature:
+    """Create a signature of a classmethod for batch creation."""
+    objs = Parameter("objs", Parameter.POSITIONAL_OR_KEYWORD)
+    objs = objs.replace(annotation=Iterable[cls])
+    return Signature([objs], return_annotation=get_return(cls))
+
+
+def get_cached(cls: Any, name: str, fget: Callable[..., Any]) -> Any:
+    """Get a cached attribute of a class (or create and cache it)."""
+    if (attr := cls.__dict__.get(name)) is None:
+        setattr(cls, name, attr := fget(cls))
+
+    return attr
+
+
 def get_factory(cls: Any) -> Callable[..., Any]:
     """Extract a pandas factory from a class."""
     factory = get_return(cls)
@@ -1,23 +1,115 @@
 # standard library
-from typing import cast
+from dataclasses import dataclass, replace
+from pathlib import Path
+from typing import Annotated as Ann, Any, cast
 
 
 # dependencies
+import numpy as np
 import pandas as pd
 from pandas.testing import assert_frame_equal, assert_series_equal
-from pandas_dataclasses import Spec, Tag, asframe, asseries
+from pandas_dataclasses import Attr, Data, Index, Multiple, Spec, Tag
+from pandas_dataclasses import asframe, aspandas, asseries
+from pandas_dataclasses.core import api
+from pandas_dataclasses.core.specs import Fields
 from pandas_dataclasses.core.api import (
+    build_index,
+    ensure,
     get_attrs,
+    get_block,
     get_columns,
     get_data,
+    get_converter,
     get_index,
+    get_kind,
+    get_range,
+    get_smallest,
+    is_mapped,
     name,
 )
+from pytest import MonkeyPatch, raises
 from .data import Weather, weather, df_weather_true, ser_weather_true
 
 
 # test data
+weather_f = replace(weather, temp_unit="deg F")
 spec = Spec.from_dataclass(Weather) @ weather
+weather_np = replace(
+    weather,
+    temp_avg=np.array(weather.temp_avg),
+    temp_max=np.array(weather.temp_max),
+    wind_avg=np.array(weather.wind_avg),
+    wind_max=np.array(weather.wind_max),
+)
+
+
+@dataclass
+class Point:
+    time: Index[int]
+    x: Data[float]
+    y: Data[float]
+    unit: Attr[str] = "m"
+    __pandas_engine__ = "codegen"
+
+
+point = Point([0, 1, 3], [1.0, 2.0, 3.0], [4.0, 5.0, 6.0])
+
+
+@dataclass
+class Channels:
+    time: Index[int]
+    data: Multiple[Data[float]]
+
+
+@dataclass
+class Station:
+    station: Index[str]
+    value: Data[float]
+    flag: Data[str]
+    __pandas_categorize__ = ("station", "flag")
+
+
+@dataclass
+class Sensor:
+    count: Data[Any]
+    level: Data[Any]
+    value: Data[Any]
+    total: Data[int]
+    __pandas_downcast__ = "safe"
+
+
+@dataclass
+class Note:
+    text: Data[Any]
+    __pandas_downcast__ = "safe"
+
+
+@dataclass
+class Shared:
+    first: Ann[Data[float], "x"]
+    second: Ann[Data[float], "x"]
+
+
+@dataclass
+class Levels:
+    time: Index[int]
+    data: Multiple[Data[Any]]
+    __pandas_categorize__ = ("data",)
+
+
+@dataclass
+class Counts:
+    time: Index[int]
+    data: Multiple[Data[Any]]
+    __pandas_downcast__ = "safe"
+
+
+channels = np.arange(12).reshape(4, 3)
+df_channels_true = pd.DataFrame(
+    channels.astype(float),
+    index=pd.RangeIndex(0, 8, 2, name="time"),
+    columns=["a", "b", "c"],
+)
 
 
 # test functions
@@ -29,6 +121,20 @@ def test_asseries() -> None:
     assert_series_equal(asseries(weather), ser_weather_true)
 
 
+def test_aspandas() -> None:
+    assert_frame_equal(aspandas(weather, factory=pd.DataFrame), df_weather_true)
+    assert_series_equal(aspandas(weather, factory=pd.Series), ser_weather_true)
+
+
+def test_get_kind() -> None:
+    def factory(*args: Any, **kwargs: Any) -> pd.DataFrame:
+        return pd.DataFrame(*args, **kwargs)
+
+    assert get_kind(pd.DataFrame) is pd.DataFrame
+    assert get_kind(pd.Series) is pd.Series
+    assert get_kind(factory) is pd.DataFrame
+
+
 def test_get_attrs() -> None:
     attrs = get_attrs(spec)
 
@@ -46,6 +152,22 @@ def test_get_columns() -> None:
     assert columns.names == name(spec.fields.of(Tag.DATA))  # type: ignore
 
 
+def test_get_columns_cache() -> None:
+    columns_1 = cast(pd.MultiIndex, get_columns(spec))
+    columns_2 = cast(pd.MultiIndex, get_columns(spec))
+    columns_3 = cast(
+        pd.MultiIndex, get_columns(Spec.from_dataclass(Weather) @ weather_f)
+    )
+
+    assert columns_1 is not columns_2 and columns_1.equals(columns_2)
+    assert np.shares_memory(columns_1.codes[0], columns_2.codes[0])
+    assert not np.shares_memory(columns_1.codes[0], columns_3.codes[0])
+    assert columns_3[0] == ("Temperature (deg F)", "Average")
+
+    columns_1.names = ["x", "y"]
+    assert columns_2.names == ["Measurement", "Statistic"]
+
+
 def test_get_data() -> None:
     data = get_data(spec)
 
@@ -63,3 +185,283 @@ def test_get_index() -> None:
         assert level.name == spec.fields.of(Tag.INDEX)[i].name
         assert level.dtype.name == spec.fields.of(Tag.INDEX)[i].dtype
         assert (level == spec.fields.of(Tag.INDEX)[i].default).all()
+
+
+def test_asframe_no_copy() -> None:
+    obj = replace(weather, temp_avg=np.array(weather.temp_avg))
+    df_weather = asframe(obj, copy=False)
+
+    assert_frame_equal(df_weather, df_weather_true)
+    assert np.shares_memory(df_weather.iloc[:, 0].to_numpy(), obj.temp_avg)
+    assert not np.shares_memory(asframe(obj).iloc[:, 0].to_numpy(), obj.temp_avg)
+
+
+def test_asframe_never_copy() -> None:
+    obj = weather_np
+    df_weather = asframe(obj, copy="never")
+
+    for i, field in enumerate(spec.data):
+        column = df_weather.iloc[:, i].to_numpy()
+        assert np.shares_memory(column, getattr(obj, field.id))
+
+    with raises(ValueError):
+        asframe(weather, copy="never")
+
+    with raises(ValueError):
+        asframe(replace(obj, temp_avg=np.array([1, 2, 3, 4, 5])), copy="never")
+
+
+def test_asframe_never_copy_untyped() -> None:
+    obj = Sensor(*np.array([[1, 2], [3, 4], [5, 6], [7, 8]]))  # type: ignore
+    assert np.shares_memory(asframe(obj, copy="never")["count"].array, obj.count)  # type: ignore
+
+    with raises(ValueError):
+        asframe(replace(obj, count=np.array(["a", "b"])), copy="never")
+
+
+def test_asframe_memmap(tmp_path: Path) -> None:
+    np.save(path := tmp_path / "temp_avg.npy", np.array(weather.temp_avg))
+    np.save(index := tmp_path / "year.npy", np.array(weather.year))
+    obj = replace(weather_np, temp_avg=path, year=index)
+    df_weather = asframe(obj, copy="never")
+
+    assert_frame_equal(df_weather, df_weather_true)
+    assert is_mapped(df_weather.iloc[:, 0].to_numpy())
+    assert not is_mapped(df_weather.iloc[:, 1].to_numpy())
+
+    index = build_index({"Year": ensure(index, "int64")})
+    assert is_mapped(cast(pd.Index, index).to_numpy())
+
+
+def test_asseries_no_copy() -> None:
+    obj = weather_np
+    ser_weather = asseries(obj, copy="never")
+
+    assert_series_equal(ser_weather, ser_weather_true)
+    assert np.shares_memory(ser_weather.to_numpy(), obj.temp_avg)
+
+
+def test_get_range(monkeypatch: MonkeyPatch) -> None:
+    monkeypatch.setattr(api, "RANGE_CHUNKSIZE", 4)
+    values = np.arange(3, 30, 3)
+
+    assert pd.RangeIndex(3, 30, 3).equals(get_range(values))
+    assert pd.RangeIndex(27, 0, -3).equals(get_range(values[::-1]))
+    assert get_range(np.where(values == 15, 16, values)) is None
+    assert get_range(np.append(values, 31)) is None
+    assert get_range(np.zeros(10, dtype="int64")) is None
+
+
+def test_build_index() -> None:
+    index = build_index({"x": pd.array([1.0, 2.0, 3.0])})
+    assert type(index) is pd.Index and index.name == "x"
+
+    index = build_index({"x": pd.array([0, 2, 4], dtype="int64")})
+    assert isinstance(index, pd.RangeIndex) and list(index) == [0, 2, 4]
+
+    index = build_index({"x": pd.array([0, 2, 5], dtype="int64")})
+    assert type(index) is pd.Index and list(index) == [0, 2, 5]
+
+    index = build_index({"x": pd.array(["2020-01-01"], dtype="datetime64[ns]")})
+    assert isinstance(index, pd.DatetimeIndex)
+
+    index = build_index({"x": pd.array([1, 2]), "y": pd.array([3])})
+    assert isinstance(index, pd.MultiIndex) and list(index) == [(1, 3), (2, 3)]
+
+    assert build_index({}) is None
+
+
+def test_get_converter() -> None:
+    assert get_converter(Point, "frame") is get_converter(Point, "frame")
+    assert get_converter(Point, "series") is not None
+    assert get_converter(Weather, "frame") is None
+
+
+def test_asframe_codegen() -> None:
+    frame = asframe(point)
+    expected = pd.DataFrame(
+        {"x": [1.0, 2.0, 3.0], "y": [4.0, 5.0, 6.0]},
+        index=pd.Index([0, 1, 3], name="time"),
+    )
+    expected.attrs = {"unit": "m"}
+
+    assert_frame_equal(frame, expected)
+    assert frame.attrs == expected.attrs
+    assert_frame_equal(asframe(point, copy=False), expected)
+    assert "build_block" in cast(Any, get_converter(Point, "frame")).__code__.co_names
+    assert_frame_equal(asframe(replace(point, y=[4.0])), expected.assign(y=4.0))
+
+
+def test_asseries_codegen() -> None:
+    series = asseries(point)
+    expected = pd.Series(
+        [1.0, 2.0, 3.0],
+        index=pd.Index([0, 1, 3], name="time"),
+        name="x",
+    )
+
+    assert_series_equal(series, expected)
+    assert series.attrs == {"unit": "m"}
+
+
+def test_asframe_columns() -> None:
+    obj = replace(weather, wind_max=["invalid"] * 5)
+    keys = [("Wind speed (m/s)", "Average"), "temp_avg"]
+    df_weather = asframe(obj, columns=keys)
+
+    assert_frame_equal(df_weather, df_weather_true.iloc[:, [2, 0]])
+
+    with raises(ValueError):
+        asframe(weather, columns=["invalid"])
+
+
+def test_asframe_exclude() -> None:
+    obj = replace(weather, wind_max=["invalid"] * 5)
+    df_weather = asframe(obj, exclude=["wind_max"])
+
+    assert_frame_equal(df_weather, df_weather_true.iloc[:, :3])
+    assert_frame_equal(asframe(weather, exclude=["invalid"]), df_weather_true)
+
+
+def test_asseries_columns() -> None:
+    obj = replace(weather, wind_max=["invalid"] * 5)
+    ser_weather = asseries(obj, columns=["temp_max"])
+
+    assert_series_equal(asseries(obj), ser_weather_true)
+    assert_series_equal(ser_weather, df_weather_true.iloc[:, 1], check_names=False)
+    assert ser_weather.name == ("Temperature (deg C)", "Maximum")
+
+
+def test_get_block() -> None:
+    block = cast(np.ndarray, get_block(spec))
+
+    assert block.shape == (5, 4) and block.flags.f_contiguous
+    assert (block == df_weather_true.to_numpy()).all()
+    assert get_block(replace(spec, fields=Fields(spec.fields[:-1]))) is not None
+    assert (
+        get_block(Spec.from_dataclass(Weather) @ replace(weather, wind_max=[1.0]))
+        is None
+    )
+
+
+def test_asframe_block() -> None:
+    df_weather = asframe(weather)
+
+    values = df_weather.to_numpy()
+
+    for i in range(df_weather.shape[1]):
+        assert np.shares_memory(values, df_weather.iloc[:, i].to_numpy())
+
+
+def test_asframe_block_factory() -> None:
+    def factory(data: Any = None, index: Any = None, columns: Any = None) -> Any:
+        return pd.DataFrame(data, index, columns)
+
+    assert_frame_equal(asframe(weather, factory=factory), df_weather_true)
+
+
+def test_asframe_block_names() -> None:
+    df_shared = asframe(Shared([1.0, 2.0], [3.0, 4.0]))  # type: ignore
+    assert_frame_equal(df_shared, pd.DataFrame({"x": [3.0, 4.0]}))
+
+    obj = Channels(np.arange(0, 8, 2), (["a", "a", "c"], channels))  # type: ignore
+    assert_frame_equal(
+        asframe(obj), df_channels_true[["b", "c"]].set_axis(["a", "c"], axis=1)
+    )
+
+
+def test_asframe_matrix() -> None:
+    obj = Channels(np.arange(0, 8, 2), (["a", "b", "c"], channels))  # type: ignore
+    df_channels = asframe(obj)
+
+    assert_frame_equal(df_channels, df_channels_true)
+    assert not np.shares_memory(df_channels.to_numpy(), channels)
+
+
+def test_asframe_matrix_frame() -> None:
+    frame = pd.DataFrame(channels, columns=["a", "b", "c"])
+    obj = Channels(np.arange(0, 8, 2), frame)  # type: ignore
+
+    assert_frame_equal(asframe(obj), df_channels_true)
+
+
+def test_asframe_matrix_frame_index() -> None:
+    frame = pd.DataFrame(channels.astype(float), columns=["a", "b", "c"])
+    obj = Channels(np.arange(0, 8, 2), frame)  # type: ignore
+
+    assert_frame_equal(asframe(obj, copy=False), df_channels_true)
+    assert_frame_equal(asframe(obj, copy="never"), df_channels_true)
+    assert_series_equal(asseries(obj), df_channels_true["a"])
+
+
+def test_asframe_matrix_no_copy() -> None:
+    matrix = channels.astype(float)
+    obj = Channels(np.arange(0, 8, 2), (["a", "b", "c"], matrix))  # type: ignore
+    df_channels = asframe(obj, copy="never")
+
+    assert_frame_equal(df_channels, df_channels_true)
+    assert np.shares_memory(df_channels.iloc[:, 0].to_numpy(), matrix)
+
+    with raises(ValueError):
+        asframe(Channels([0], (["a"], matrix)))  # type: ignore
+
+
+def test_asframe_categorize() -> None:
+    df_1 = asframe(Station(["a", "b", "a"], [1.0, 2.0, 3.0], ["x", "x", "y"]))
+    df_2 = asframe(Station(["c", "a"], [4.0, 5.0], ["y", "z"]))
+    index_1 = cast(pd.CategoricalIndex, df_1.index)
+    index_2 = cast(pd.CategoricalIndex, df_2.index)
+
+    assert list(index_1) == ["a", "b", "a"]
+    assert list(index_2) == ["c", "a"]
+    assert list(index_2.categories) == ["a", "b", "c"]
+    assert list(index_2.codes) == [2, 0]
+    assert df_1["flag"].dtype == "category" and df_1["value"].dtype == "float64"
+    assert list(df_2["flag"].cat.categories) == ["x", "y", "z"]
+
+    with raises(ValueError):
+        asframe(Station(["a"], np.array([1.0]), ["x"]), copy="never")  # type: ignore
+
+
+def test_asframe_downcast() -> None:
+    obj = Sensor([1, 300, None], np.array([-1, 5, 7]), [0.5, 1.5, 2.5], [1, 2, 3])
+    df_sensor = asframe(obj)  # type: ignore
+
+    assert df_sensor["count"].dtype == "Int16"
+    assert df_sensor["level"].dtype == "Int8"
+    assert df_sensor["value"].dtype == "Float32"
+    assert df_sensor["total"].dtype == "int64"
+    assert df_sensor["count"].isna().tolist() == [False, False, True]
+
+    obj = Sensor(*np.array([[1, 2], [3, 4], [5, 6], [7, 8]]))  # type: ignore
+    assert (asframe(obj, copy="never").dtypes.iloc[:3] == "Int64").all()
+
+
+def test_asframe_downcast_str(monkeypatch: MonkeyPatch) -> None:
+    obj = Note(pd.Series(["a", "b"], dtype=object))
+
+    monkeypatch.setattr(api, "get_string_dtype", lambda: None)
+    assert asframe(obj)["text"].dtype == object
+
+    monkeypatch.setattr(api, "get_string_dtype", lambda: pd.StringDtype("python"))
+    assert asframe(obj)["text"].dtype == "string"
+
+
+def test_asframe_matrix_policies() -> None:
+    obj = Levels(np.arange(0, 8, 2), (["a", "b", "c"], channels % 2))  # type: ignore
+    df_levels = asframe(obj)
+
+    assert (df_levels.dtypes == "category").all()
+    assert df_levels["a"].tolist() == [0, 1, 0, 1]
+
+    obj = Counts(np.arange(0, 8, 2), (["a", "b", "c"], channels))  # type: ignore
+    assert (asframe(obj).dtypes == "Int8").all()
+
+
+def test_get_smallest() -> None:
+    assert get_smallest(np.array([0, 255], dtype="uint64")) == np.uint8
+    assert get_smallest(np.array([-129, 127])) == np.int16
+    assert get_smallest(np.array([0, 2**40])) is None
+    assert get_smallest(np.array([0.1, np.nan])) is None
+    assert get_smallest(np.array([0.5, np.nan])) == np.float32
+    assert get_smallest(np.array(["a"])) is None
@@ -0,0 +1,222 @@
+# standard library
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, make_dataclass, replace
+from pathlib import Path
+from typing import Any
+
+
+# dependencies
+import numpy as np
+import pandas as pd
+from pandas.testing import assert_frame_equal
+from pandas_dataclasses import (
+    Attr,
+    Data,
+    Index,
+    asframe_chunks,
+    asframe_many,
+    asframe_parallel,
+    asframe_records,
+    cache_info,
+    Spec,
+)
+from pytest import raises
+from .data import Weather, weather, df_weather_true
+
+
+# test data
+weather_np = replace(
+    weather,
+    year=np.array(weather.year),
+    month=np.array(weather.month),
+    temp_avg=np.array(weather.temp_avg),
+)
+records = [
+    Weather(*row)
+    for row in zip(
+        weather.year,
+        weather.month,
+        weather.temp_avg,
+        weather.temp_max,
+        weather.wind_avg,
+        weather.wind_max,
+    )
+]
+
+
+@dataclass
+class Point:
+    time: Index[float]
+    value: Data[int]
+
+
+points = [Point(0.5 * i, i) for i in range(5)]  # type: ignore
+
+
+@dataclass
+class Station:
+    station: Index[str]
+    message: Data[str]
+
+
+stations = [Station(f"station-{i}", f"hello-{i}") for i in range(5)]
+
+
+@dataclass
+class Reading:
+    value: Data[float]
+    coeffs: Attr[Any]
+
+
+# test functions
+def test_asframe_many() -> None:
+    df_weather = asframe_many([weather, weather_np, weather])
+    df_weather_concat = pd.concat([df_weather_true] * 3)
+
+    assert_frame_equal(df_weather, df_weather_concat)
+    assert df_weather.attrs == df_weather_true.attrs
+
+
+def test_asframe_many_broadcast() -> None:
+    df_weather = asframe_many([replace(weather, year=2020, temp_avg=[0.0])])
+
+    assert (df_weather.index.get_level_values("Year") == 2020).all()
+    assert (df_weather.iloc[:, 0] == 0.0).all()
+
+
+def test_asframe_many_attrs() -> None:
+    with raises(ValueError):
+        asframe_many([weather, replace(weather, loc="Osaka")])
+
+
+def test_asframe_many_attrs_array() -> None:
+    objs = [Reading([1.0], np.array([1, 2])), Reading([2.0], np.array([1, 2]))]
+    df_readings = asframe_many(objs)  # type: ignore
+
+    assert (df_readings.attrs["coeffs"] == [1, 2]).all()
+
+    with raises(ValueError):
+        asframe_many(objs + [Reading([3.0], np.array([1, 3]))])  # type: ignore
+
+
+def test_asframe_many_memmap(tmp_path: Path) -> None:
+    np.save(path := tmp_path / "value.npy", np.arange(3))
+    df_points = asframe_many([Point([0.0, 1.0, 2.0], path), points[0]])  # type: ignore
+
+    assert df_points["value"].tolist() == [0, 1, 2, 0]
+
+
+def test_asframe_many_columns() -> None:
+    with raises(ValueError):
+        asframe_many([weather, replace(weather, temp_unit="deg F")])
+
+
+def test_asframe_many_length() -> None:
+    objs = [Point([1, 2, 3], [1, 2]), Point([4, 5], [3, 4, 5])]  # type: ignore
+
+    with raises(ValueError):
+        asframe_many(objs)
+
+
+def test_asframe_many_empty() -> None:
+    with raises(ValueError):
+        asframe_many([])
+
+
+def test_asframe_records() -> None:
+    df_weather = asframe_records(iter(records))
+
+    assert_frame_equal(df_weather, df_weather_true)
+    assert df_weather.attrs == df_weather_true.attrs
+
+
+def test_asframe_records_str() -> None:
+    df_stations = asframe_records(stations)
+
+    assert df_stations.index.tolist() == [obj.station for obj in stations]
+    assert df_stations["message"].tolist() == [obj.message for obj in stations]
+
+
+def test_asframe_records_type() -> None:
+    with raises(TypeError):
+        asframe_records([*records, object()])  # type: ignore
+
+
+def test_asframe_chunks() -> None:
+    df_weathers = list(asframe_chunks(iter(records), chunk_rows=2))
+
+    assert [len(df) for df in df_weathers] == [2, 2, 1]
+    assert_frame_equal(pd.concat(df_weathers), df_weather_true)
+
+    for df_weather in df_weathers:
+        assert df_weather.attrs == df_weather_true.attrs
+        assert (df_weather.columns == df_weather_true.columns).all()
+
+
+def test_asframe_chunks_max_bytes() -> None:
+    df_weathers = list(asframe_chunks(records, max_bytes=3 * 48))
+
+    assert [len(df) for df in df_weathers] == [3, 2]
+    assert_frame_equal(pd.concat(df_weathers), df_weather_true)
+
+
+def test_asframe_chunks_size() -> None:
+    with raises(ValueError):
+        list(asframe_chunks(records))
+
+    with raises(ValueError):
+        list(asframe_chunks(records, chunk_rows=0))
+
+
+def test_asframe_chunks_buffers() -> None:
+    df_points = list(asframe_chunks(points, chunk_rows=2))
+
+    assert list(pd.concat(df_points).index) == [0.0, 0.5, 1.0, 1.5, 2.0]
+    assert list(pd.concat(df_points)["value"]) == [0, 1, 2, 3, 4]
+
+
+def test_asframe_chunks_str() -> None:
+    df_stations = pd.concat(asframe_chunks(stations, chunk_rows=2))
+
+    assert df_stations.index.tolist() == [obj.station for obj in stations]
+    assert df_stations["message"].tolist() == [obj.message for obj in stations]
+
+
+def test_asframe_chunks_factory() -> None:
+    def factory(data: Any = None, index: Any = None, columns: Any = None) -> Any:
+        return pd.DataFrame(data, index, columns)
+
+    df_points = pd.concat(asframe_chunks(points, chunk_rows=2, factory=factory))
+    assert list(df_points["value"]) == [0, 1, 2, 3, 4]
+
+
+def test_parallel() -> None:
+    dfs = asframe_parallel([weather, weather_np, weather])
+
+    assert len(dfs) == 3
+
+    for df in dfs:
+        assert_frame_equal(df, df_weather_true)
+
+
+def test_parallel_executor() -> None:
+    with ThreadPoolExecutor(2) as executor:
+        dfs = asframe_parallel([weather] * 4, executor, copy=False)
+
+    assert len(dfs) == 4
+    assert_frame_equal(dfs[-1], df_weather_true)
+
+
+def test_spec_threads() -> None:
+    cls = make_dataclass("Sample", [("data", "Data[int]")])
+    cls.__module__ = __name__
+    misses = cache_info()["spec"].misses
+
+    with ThreadPoolExecutor(8) as executor:
+        specs = list(executor.map(Spec.from_dataclass, [cls] * 32))
+
+    for spec in specs:
+        assert spec is specs[0]
+        assert spec.data[0].dtype == "int64"
+
+    assert cache_info()["spec"].misses == misses + 1
@@ -0,0 +1,196 @@
+# standard library
+import gc
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, make_dataclass
+from threading import Event
+from typing import Any, cast
+from weakref import ref
+
+
+# dependencies
+import numpy as np
+import pandas as pd
+from pytest import MonkeyPatch
+from pandas_dataclasses import Data, Index, Spec, asframe, cache_info, clear_cache
+from pandas_dataclasses.core import cache as core_cache, specs
+from pandas_dataclasses.core.api import is_immutable
+from pandas_dataclasses.core.cache import INDEX_CACHE, ClassCache, IndexCache
+
+
+# test data
+@dataclass
+class Station:
+    station: Index[str]
+    time: Index[int]
+    value: Data[float]
+
+
+stations = pd.Index(["a", "b", "c"] * 2)
+times = np.repeat(np.arange(2), 3)
+times.flags.writeable = False
+
+
+# test functions
+def test_index_cache() -> None:
+    cache = IndexCache(maxbytes=100)
+    index = pd.Index(np.arange(5))
+
+    cache.set("a", (), index)
+    cache.set("b", (), index)
+    assert "a" in cache and "b" in cache and cache.nbytes == 80
+
+    assert cache.get("a") is not index
+    cache.set("c", (), index)
+    assert "a" in cache and "b" not in cache and len(cache) == 2
+
+    cache.set("d", (), pd.Index(np.arange(20)))
+    assert "d" not in cache
+
+    cache.clear()
+    assert len(cache) == 0 and cache.nbytes == 0
+
+
+def test_asframe_index_cache() -> None:
+    df_1 = asframe(Station(stations, times, [1.0] * 6))  # type: ignore
+    df_2 = asframe(Station(stations, times, [2.0] * 6))  # type: ignore
+    index_1 = df_1.index
+    index_2 = df_2.index
+
+    assert index_1 is not index_2 and index_1.equals(index_2)
+    assert np.shares_memory(index_1.codes[1], index_2.codes[1])  # type: ignore
+
+    index_1.names = ["x", "y"]
+    assert index_2.names == ["station", "time"]
+
+
+def test_asframe_index_cache_mutable() -> None:
+    INDEX_CACHE.clear()
+    asframe(Station(list(stations), times, [1.0] * 6))  # type: ignore
+
+    assert len(INDEX_CACHE) == 0
+
+
+def test_asframe_index_cache_categorize() -> None:
+    INDEX_CACHE.clear()
+    cls = make_dataclass(
+        "Sample",
+        [("station", "Index[str]"), ("value", "Data[float]")],
+        namespace={"__pandas_categorize__": ("station",)},
+    )
+    cls.__module__ = __name__
+    stations = ("a", "b")
+
+    asframe(cls(stations, [1.0, 2.0]))
+    asframe(cls(("c",), [3.0]))
+    index = cast(pd.CategoricalIndex, asframe(cls(stations, [1.0, 2.0])).index)
+
+    assert list(index.categories) == ["a", "b", "c"]
+    assert len(INDEX_CACHE) == 0
+
+    cls_ref = ref(cls)
+    del cls
+    gc.collect()
+    assert cls_ref() is None
+
+
+def test_is_immutable() -> None:
+    assert is_immutable(1)
+    assert is_immutable((1, 2))
+    assert is_immutable(stations)
+    assert is_immutable(times)
+    assert is_immutable(times[1:])
+    assert not is_immutable([1, 2])
+    assert not is_immutable(np.arange(2))
+
+    view = np.arange(2)[:1]
+    view.flags.writeable = False
+    assert not is_immutable(view)
+
+
+def test_class_cache() -> None:
+    cache = ClassCache("__test__", maxsize=2)
+    classes = [make_dataclass(f"Sample{i}", []) for i in range(3)]
+
+    assert cache.get(classes[0], id) == id(classes[0])
+    assert cache.get(classes[0], id) == id(classes[0])
+    assert cache.get(classes[1], id) == id(classes[1])
+    assert classes[0] in cache and len(cache) == 2
+
+    cache.get(classes[0], id)
+    cache.get(classes[2], id)
+    assert classes[0] in cache and classes[1] not in cache
+    assert cache.info() == (2, 3, 1, 2, 2)
+
+    del classes[2]
+    gc.collect()
+    assert len(cache) == 1
+
+    cache.clear()
+    assert classes[0] not in cache and cache.info() == (0, 0, 0, 2, 0)
+
+
+def test_class_cache_hit() -> None:
+    cache = ClassCache("__test__", maxsize=2)
+    classes = [make_dataclass(f"Hit{i}", []) for i in range(3)]
+    cache.get(classes[0], id)
+    cache.get(classes[1], id)
+
+    lock, cache.lock = cache.lock, cast(Any, None)
+    assert cache.get(classes[0], id) == id(classes[0])
+    cache.lock = lock
+
+    cache.get(classes[2], id)
+    assert classes[0] in cache and classes[1] not in cache
+    assert cache.info() == (1, 3, 1, 2, 2) and cache.info().hits == 1
+
+
+def test_class_cache_threads() -> None:
+    cache = ClassCache("__test__", maxsize=256)
+    cached = [make_dataclass(f"Cached{i}", []) for i in range(4)]
+    created = [make_dataclass(f"Created{i}", []) for i in range(3000)]
+    done = Event()
+
+    def read(cls: type) -> None:
+        while not done.is_set():
+            cache.get(cls, id)
+
+    def create() -> None:
+        try:
+            for cls in created:
+                cache.get(cls, id)
+        finally:
+            done.set()
+
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+
+    try:
+        with ThreadPoolExecutor(5) as executor:
+            futures = [executor.submit(read, cls) for cls in cached]
+            futures.append(executor.submit(create))
+    finally:
+        sys.setswitchinterval(interval)
+
+    for future in futures:
+        future.result()
+
+    assert len(cache) == 256
+
+
+def test_clear_cache(monkeypatch: MonkeyPatch) -> None:
+    monkeypatch.setattr(specs, "SPEC_CACHE", cache := ClassCache("__pandas_spec__"))
+    monkeypatch.setattr(core_cache, "SPEC_CACHE", cache)
+
+    cls = make_dataclass("Sample", [("data", "Data[int]")])
+    cls.__module__ = __name__
+    spec = Spec.from_dataclass(cls)
+
+    assert Spec.from_dataclass(cls) is spec
+    assert "__pandas_spec__" in vars(cls)
+    assert cache_info()["spec"].hits > 0
+
+    clear_cache()
+    assert "__pandas_spec__" not in vars(cls)
+    assert Spec.from_dataclass(cls) is not spec
+    assert cache_info()["spec"].misses == 1 and len(INDEX_CACHE) == 0
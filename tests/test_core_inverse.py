@@ -0,0 +1,73 @@
+# standard library
+from dataclasses import dataclass
+from typing import Any
+
+
+# dependencies
+import numpy as np
+import pandas as pd
+from pandas.testing import assert_frame_equal
+from pandas_dataclasses import Data, Index, asframe, asframe_records
+from pandas_dataclasses import from_frame, from_frame_records
+from .data import Weather, weather, df_weather_true
+
+
+# test data
+df_weather = df_weather_true.copy()
+df_weather.columns = df_weather.columns.set_levels(  # type: ignore
+    ["Temperature (deg F)", "Wind speed (km/h)"],
+    level=0,
+)
+
+
+@dataclass
+class Event:
+    time: Index[Any]
+    duration: Data[Any]
+
+
+df_event = pd.DataFrame(
+    {"duration": pd.to_timedelta([1, 2], unit="s")},
+    index=pd.DatetimeIndex(["2020-01-01", "2020-01-02"], name="time"),
+)
+
+
+# test functions
+def test_from_frame() -> None:
+    obj = from_frame(Weather, df_weather_true)
+
+    assert_frame_equal(asframe(obj), df_weather_true)
+    assert obj.loc == weather.loc
+    assert obj.temp_unit == weather.temp_unit
+
+
+def test_from_frame_formatted() -> None:
+    obj = from_frame(Weather, df_weather)
+
+    assert obj.temp_unit == "deg F"
+    assert obj.wind_unit == "km/h"
+    assert_frame_equal(asframe(obj), df_weather)
+
+
+def test_from_frame_views() -> None:
+    obj = from_frame(Weather, df_weather_true)
+    column = df_weather_true.iloc[:, 0]
+
+    assert np.shares_memory(obj.temp_avg, column.values)  # type: ignore
+
+
+def test_from_frame_records() -> None:
+    objs = list(from_frame_records(Weather, df_weather_true))
+
+    assert len(objs) == len(df_weather_true)
+    assert objs[0].year == weather.year[0]  # type: ignore
+    assert objs[0].temp_avg == weather.temp_avg[0]  # type: ignore
+    assert_frame_equal(asframe_records(objs), df_weather_true)
+
+
+def test_from_frame_records_datetime() -> None:
+    objs = list(from_frame_records(Event, df_event))
+
+    assert objs[0].time == pd.Timestamp("2020-01-01")
+    assert objs[1].duration == pd.Timedelta(2, unit="s")
+    assert_frame_equal(asframe_records(objs), df_event)
@@ -0,0 +1,89 @@
+# standard library
+from dataclasses import replace
+from typing import Any
+
+
+# dependencies
+import numpy as np
+import pandas as pd
+from pandas.testing import assert_frame_equal, assert_index_equal
+from pandas.testing import assert_series_equal
+from pandas_dataclasses import LazyFrame, aslazyframe
+from pytest import raises
+from .data import weather, df_weather_true
+
+
+# test data
+weather_np = replace(weather, temp_avg=np.array(weather.temp_avg))
+key = df_weather_true.columns[0]
+
+
+# test functions
+def test_lazy_column() -> None:
+    lazy = aslazyframe(weather)
+
+    assert isinstance(lazy, LazyFrame)
+    assert_series_equal(lazy[key], df_weather_true[key])
+    assert lazy[key] is lazy[key]
+    assert not lazy.materialized
+
+
+def test_lazy_columns() -> None:
+    lazy = aslazyframe(weather)
+    keys = list(df_weather_true.columns[1:3])
+
+    assert_frame_equal(lazy[keys], df_weather_true[keys])
+    assert lazy[keys].attrs == df_weather_true.attrs
+    assert not lazy.materialized
+
+
+def test_lazy_metadata() -> None:
+    lazy = aslazyframe(weather)
+
+    assert_index_equal(lazy.columns, df_weather_true.columns)
+    assert_index_equal(lazy.index, df_weather_true.index)
+    assert lazy.attrs == df_weather_true.attrs
+    assert len(lazy) == len(df_weather_true)
+    assert list(lazy) == list(df_weather_true)
+    assert not lazy.materialized
+
+
+def test_lazy_frame() -> None:
+    lazy = aslazyframe(weather)
+
+    assert lazy.shape == df_weather_true.shape
+    assert lazy.materialized
+    assert_frame_equal(lazy.frame, df_weather_true)
+    assert_series_equal(lazy[key], df_weather_true[key])
+
+
+def test_lazy_copy() -> None:
+    lazy = aslazyframe(weather_np, copy="never")
+
+    assert np.shares_memory(lazy[key].to_numpy(), weather_np.temp_avg)
+
+    with raises(ValueError):
+        lazy[df_weather_true.columns[1]]
+
+
+def test_lazy_factory() -> None:
+    class UserFrame(pd.DataFrame):
+        pass
+
+    lazy = aslazyframe(weather, factory=UserFrame)
+
+    assert isinstance(lazy[[key]], UserFrame)
+    assert isinstance(lazy.frame, UserFrame)
+
+
+def test_lazy_operators() -> None:
+    lazy = aslazyframe(weather)
+
+    assert_frame_equal(lazy + 1, df_weather_true + 1)
+    assert_frame_equal(1 - lazy, 1 - df_weather_true)
+    assert_frame_equal(-lazy, -df_weather_true)
+    equal: Any = lazy == df_weather_true
+    greater: Any = lazy > df_weather_true
+
+    assert equal.all().all() and not greater.any().any()
+    assert lazy.materialized
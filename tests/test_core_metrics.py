@@ -0,0 +1,75 @@
+# standard library
+from dataclasses import dataclass
+from typing import Any
+
+
+# dependencies
+from pandas_dataclasses import Data, asframe, asseries, clear_metrics, enable_metrics
+from pandas_dataclasses import get_metrics
+from pandas_dataclasses.core.metrics import PHASES
+from .data import Weather, weather
+
+
+# test data
+@dataclass
+class Count:
+    value: Data[Any]
+    __pandas_downcast__ = "safe"
+
+
+key = f"{Weather.__module__}.{Weather.__qualname__}"
+
+
+# test functions
+def test_metrics() -> None:
+    clear_metrics()
+    enable_metrics()
+
+    try:
+        df_weather = asframe(weather)
+        asseries(weather)
+    finally:
+        enable_metrics(False)
+
+    metrics = get_metrics()[key]
+    assert metrics["calls"] == 2
+    assert metrics["bytes"] > df_weather.memory_usage(deep=False).sum()
+    assert set(metrics["time"]) == set(PHASES)
+    assert metrics["time"]["data"] > 0 and metrics["time"]["codegen"] == 0
+
+
+def test_metrics_saved() -> None:
+    clear_metrics()
+    enable_metrics()
+
+    try:
+        asframe(Count(list(range(100))))  # type: ignore
+        asframe(weather)
+    finally:
+        enable_metrics(False)
+
+    metrics = get_metrics()
+    assert metrics[f"{__name__}.Count"]["saved"] == 100 * (8 - 1)
+    assert metrics[key]["saved"] == 0
+
+
+def test_metrics_disabled() -> None:
+    clear_metrics()
+    asframe(weather)
+
+    assert get_metrics() == {}
+
+
+def test_metrics_snapshot() -> None:
+    clear_metrics()
+    enable_metrics()
+
+    try:
+        asframe(weather)
+        snapshot = get_metrics()
+        asframe(weather)
+    finally:
+        enable_metrics(False)
+
+    assert snapshot[key]["calls"] == 1
+    assert get_metrics()[key]["calls"] == 2
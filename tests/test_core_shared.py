@@ -0,0 +1,91 @@
+# standard library
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+
+
+# dependencies
+import numpy as np
+import pandas as pd
+from pandas.testing import assert_frame_equal
+from pandas_dataclasses import Data, Index, Multiple, asframe_many, asframe_shared
+from pytest import raises
+from .data import weather, df_weather_true
+
+
+# test data
+@dataclass
+class Point:
+    time: Index[float]
+    value: Data[int]
+
+
+@dataclass
+class Block:
+    time: Index[float]
+    data: Multiple[Data[int]]
+
+
+@dataclass
+class Label:
+    value: Data[str]
+
+
+points = [Point(np.arange(3) + i, [i] * 3) for i in range(5)]  # type: ignore
+blocks = [
+    Block(np.arange(3) + i, (["a", "b"], np.full((3, 2), i)))  # type: ignore
+    for i in range(5)
+]
+
+
+# test functions
+def test_asframe_shared() -> None:
+    df_weather = asframe_shared([weather, weather, weather])
+    df_weather_concat = pd.concat([df_weather_true] * 3)
+
+    assert_frame_equal(df_weather, df_weather_concat)
+    assert df_weather.attrs == df_weather_true.attrs
+
+
+def test_asframe_shared_executor() -> None:
+    with ProcessPoolExecutor(2) as executor:
+        df_point = asframe_shared(points, executor)
+
+    assert_frame_equal(df_point, asframe_many(points))
+
+
+def test_asframe_shared_lifetime() -> None:
+    values = asframe_shared(points)["value"].to_numpy()
+
+    assert values.sum() == 3 * sum(range(5))
+
+
+def test_asframe_shared_errors() -> None:
+    with raises(ValueError):
+        asframe_shared([])
+
+    with raises(ValueError):
+        asframe_shared([Label(["a"])])  # type: ignore
+
+    with raises(ValueError):
+        asframe_shared([Point([1.0, 2.0], [1, 2, 3])])  # type: ignore
+
+
+def test_asframe_shared_invalid() -> None:
+    with ThreadPoolExecutor(2) as executor:
+        with raises(ValueError):
+            asframe_shared([Point([0.0], ["a"])], executor)  # type: ignore
+
+
+def test_asframe_shared_workers() -> None:
+    with ThreadPoolExecutor(2) as executor:
+        df_point = asframe_shared(points, executor, workers=3)
+
+    assert_frame_equal(df_point, asframe_many(points))
+
+
+def test_asframe_shared_block() -> None:
+    with ThreadPoolExecutor(2) as executor:
+        df_block = asframe_shared(blocks, executor)
+
+    assert list(df_block.columns) == ["a", "b"]
+    assert_frame_equal(df_block, asframe_many(blocks))
@@ -1,5 +1,5 @@
 # standard library
-from dataclasses import MISSING
+from dataclasses import MISSING, replace
 
 
 # dependencies
@@ -215,3 +215,48 @@ def test_name() -> None:
 
 def test_origin() -> None:
     assert spec.origin is Weather
+
+
+def test_cache() -> None:
+    assert Spec.from_dataclass(Weather) is spec
+
+
+def test_roles() -> None:
+    assert spec.attrs == spec.fields.of(Tag.ATTR)
+    assert spec.data == spec.fields.of(Tag.DATA)
+    assert spec.index == spec.fields.of(Tag.INDEX)
+    assert spec_updated.data == spec_updated.fields.of(Tag.DATA)
+
+
+def test_mask() -> None:
+    for field in spec.fields:
+        assert field.mask == Tag.union(field.tags).value
+
+    for field in spec_updated.fields:
+        assert field.mask == Tag.union(field.tags).value
+
+
+def test_selection() -> None:
+    assert spec.fields.of(Tag.DATA) is spec.fields.of(Tag.DATA)
+    assert spec_updated.fields.positions is spec.fields.positions
+    assert len(spec.fields.of(Tag.DATA | Tag.INDEX)) == 6
+
+
+def test_dynamic() -> None:
+    assert spec.fields.of(Tag.DATA)[0].dynamic
+    assert not spec.fields.of(Tag.INDEX)[0].dynamic
+    assert spec_updated.fields.of(Tag.DATA)[0].dynamic
+    assert spec_updated.fields.of(Tag.INDEX)[0].name is spec.index[0].name
+
+
+def test_update_static() -> None:
+    assert spec_updated.fields is not spec.fields
+    assert spec.data[0].name != spec_updated.data[0].name
+    assert spec_updated.data == spec_updated.fields.of(Tag.DATA)
+    assert spec_updated.data is not spec.data
+
+
+def test_dtype() -> None:
+    assert spec.dtype == "float64"
+    assert spec_updated.dtype == "float64"
+    assert replace(spec, fields=spec.index).dtype is None
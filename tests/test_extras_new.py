@@ -1,12 +1,14 @@
 # standard library
 from dataclasses import dataclass
-from typing import Any
+from inspect import signature
+from typing import Any, cast
 
 
 # dependencies
 import pandas as pd
 from pandas.testing import assert_frame_equal, assert_series_equal
-from pandas_dataclasses import As, AsFrame, AsSeries
+from pandas_dataclasses import As, AsFrame, AsSeries, Data, Index
+from pytest import raises
 from .data import Weather, weather, df_weather_true, ser_weather_true
 
 
@@ -53,6 +55,12 @@ class FloatSeries(Weather, As["pd.Series[float]"], factory=pd.Series):
     pass
 
 
+@dataclass
+class Record(AsFrame):
+    time: Index[int]
+    value: Data[float]
+
+
 # test functions
 def test_frame() -> None:
     df_weather = Frame.new(
@@ -136,3 +144,57 @@ def test_float_series() -> None:
 
     assert isinstance(ser_weather, pd.Series)
     assert_series_equal(ser_weather, ser_weather_true, check_series_type=False)
+
+
+def test_frame_many() -> None:
+    obj = Frame(**vars(weather))
+    df_weather = Frame.new_many([obj, obj])
+
+    assert isinstance(df_weather, pd.DataFrame)
+    assert_frame_equal(df_weather, pd.concat([df_weather_true] * 2))
+
+
+def test_frame_records() -> None:
+    records = [Record(0, 1.0), Record(2, 3.0)]  # type: ignore
+    df_record = Record.new_records(records)
+    df_record_true = pd.DataFrame(
+        {"value": [1.0, 3.0]},
+        index=pd.Index([0, 2], name="time"),
+    )
+
+    assert isinstance(df_record, pd.DataFrame)
+    assert_frame_equal(df_record, df_record_true, check_index_type=False)
+
+
+def test_series_many() -> None:
+    with raises(AttributeError):
+        Series.new_many  # type: ignore
+
+    assert not hasattr(Series, "new_records")
+
+
+def test_new_cached() -> None:
+    assert Frame.new is Frame.new
+    assert Frame.new_many is Frame.new_many
+    assert Frame.new_records is Frame.new_records
+    assert Frame.new is not CustomFrame.new
+    assert signature(Frame.new).return_annotation is pd.DataFrame
+    assert signature(Frame.new_many).return_annotation is pd.DataFrame
+
+
+def test_frame_columns() -> None:
+    df_weather = cast(
+        pd.DataFrame,
+        Frame.new(
+            year=weather.year,
+            month=weather.month,
+            temp_avg=weather.temp_avg,
+            temp_max=weather.temp_max,
+            wind_avg=weather.wind_avg,
+            wind_max=weather.wind_max,
+            columns=["temp_avg", "wind_avg"],  # type: ignore
+        ),
+    )
+
+    assert "columns" in signature(Frame.new).parameters
+    assert_frame_equal(df_weather, df_weather_true.iloc[:, [0, 2]])  # type: ignore